@@ -60,12 +60,16 @@ class UserAdmin(BaseUserAdmin, ModelAdmin):
         ),
     )
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).select_related("guardian")
+
 
 @admin.register(Guardian)
 class GuardianAdmin(ModelAdmin):
     """Admin configuration for Guardian model."""
 
     list_display = ["user", "cpf", "pix_key"]
+    list_select_related = ["user"]
     list_filter = []
     search_fields = ["user__email", "user__first_name", "user__last_name", "cpf"]
     ordering = ["user__first_name", "user__last_name"]
@@ -0,0 +1,32 @@
+"""
+Authentication backends for accounts app.
+"""
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.backends import ModelBackend
+from django.core.exceptions import PermissionDenied
+
+UserModel = get_user_model()
+
+
+class GuardianModelBackend(ModelBackend):
+    """
+    Model backend that loads the guardian profile together with the user.
+    Views read request.user.guardian on almost every request, so joining it
+    here saves one query per authenticated request.
+    """
+
+    def authenticate(self, request, username=None, password=None, **kwargs):
+        user = super().authenticate(request, username=username, password=password, **kwargs)
+        if user is None:
+            # Stop here so the plain ModelBackend listed after us (kept only to load
+            # sessions created before this backend) does not hash the password again
+            raise PermissionDenied
+        return user
+
+    def get_user(self, user_id):
+        try:
+            user = UserModel._default_manager.select_related("guardian").get(pk=user_id)
+        except UserModel.DoesNotExist:
+            return None
+        return user if self.user_can_authenticate(user) else None
@@ -5,6 +5,8 @@ Forms for accounts app.
 from django import forms
 from django.contrib.auth.forms import AuthenticationForm, UserCreationForm
 
+from apps.core.form_widgets import email_input, password_input, text_input, textarea
+
 from .models import Guardian, User
 
 
@@ -13,22 +15,11 @@ class LoginForm(AuthenticationForm):
 
     username = forms.EmailField(
         label="E-mail",
-        widget=forms.EmailInput(
-            attrs={
-                "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                "placeholder": "seu@email.com",
-                "autofocus": True,
-            }
-        ),
+        widget=email_input("seu@email.com", autofocus=True),
     )
     password = forms.CharField(
         label="Senha",
-        widget=forms.PasswordInput(
-            attrs={
-                "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                "placeholder": "••••••••",
-            }
-        ),
+        widget=password_input("••••••••"),
     )
 
 
@@ -37,62 +28,32 @@ class RegisterForm(UserCreationForm):
 
     email = forms.EmailField(
         label="E-mail",
-        widget=forms.EmailInput(
-            attrs={
-                "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                "placeholder": "seu@email.com",
-            }
-        ),
+        widget=email_input("seu@email.com"),
     )
     first_name = forms.CharField(
         label="Nome",
         max_length=150,
-        widget=forms.TextInput(
-            attrs={
-                "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                "placeholder": "Seu nome",
-            }
-        ),
+        widget=text_input("Seu nome"),
     )
     last_name = forms.CharField(
         label="Sobrenome",
         max_length=150,
         required=False,
-        widget=forms.TextInput(
-            attrs={
-                "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                "placeholder": "Seu sobrenome",
-            }
-        ),
+        widget=text_input("Seu sobrenome"),
     )
     phone = forms.CharField(
         label="Telefone",
         max_length=20,
         required=False,
-        widget=forms.TextInput(
-            attrs={
-                "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                "placeholder": "(00) 00000-0000",
-            }
-        ),
+        widget=text_input("(00) 00000-0000"),
     )
     password1 = forms.CharField(
         label="Senha",
-        widget=forms.PasswordInput(
-            attrs={
-                "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                "placeholder": "••••••••",
-            }
-        ),
+        widget=password_input("••••••••"),
     )
     password2 = forms.CharField(
         label="Confirmar senha",
-        widget=forms.PasswordInput(
-            attrs={
-                "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                "placeholder": "••••••••",
-            }
-        ),
+        widget=password_input("••••••••"),
     )
 
     class Meta:
@@ -107,21 +68,9 @@ class UserProfileForm(forms.ModelForm):
         model = User
         fields = ["first_name", "last_name", "phone"]
         widgets = {
-            "first_name": forms.TextInput(
-                attrs={
-                    "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                }
-            ),
-            "last_name": forms.TextInput(
-                attrs={
-                    "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                }
-            ),
-            "phone": forms.TextInput(
-                attrs={
-                    "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                }
-            ),
+            "first_name": text_input(),
+            "last_name": text_input(),
+            "phone": text_input(),
         }
 
 
@@ -132,34 +81,9 @@ class GuardianProfileForm(forms.ModelForm):
         model = Guardian
         fields = ["cpf", "pix_key", "pix_holder_name", "address", "notes"]
         widgets = {
-            "cpf": forms.TextInput(
-                attrs={
-                    "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                    "placeholder": "000.000.000-00",
-                }
-            ),
-            "pix_key": forms.TextInput(
-                attrs={
-                    "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                    "placeholder": "CPF, e-mail, telefone ou chave aleatória",
-                }
-            ),
-            "pix_holder_name": forms.TextInput(
-                attrs={
-                    "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                    "placeholder": "Nome que aparece ao receber PIX",
-                }
-            ),
-            "address": forms.Textarea(
-                attrs={
-                    "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                    "rows": 3,
-                }
-            ),
-            "notes": forms.Textarea(
-                attrs={
-                    "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                    "rows": 3,
-                }
-            ),
+            "cpf": text_input("000.000.000-00"),
+            "pix_key": text_input("CPF, e-mail, telefone ou chave aleatória"),
+            "pix_holder_name": text_input("Nome que aparece ao receber PIX"),
+            "address": textarea(),
+            "notes": textarea(),
         }
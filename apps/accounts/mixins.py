@@ -0,0 +1,31 @@
+"""
+View mixins for accounts app.
+"""
+
+from django.contrib.auth.mixins import LoginRequiredMixin
+
+from .models import Guardian
+
+
+class GuardianRequiredMixin(LoginRequiredMixin):
+    """Resolve the logged-in user's guardian profile once per request."""
+
+    def get_guardian(self) -> Guardian | None:
+        """Return the user's guardian, or None if the profile does not exist yet."""
+        if not hasattr(self, "_guardian"):
+            # Usually already loaded alongside the session user
+            self._guardian = getattr(self.request.user, "guardian", None)
+        return self._guardian
+
+    def get_or_create_guardian(self) -> Guardian:
+        """Return the user's guardian, creating the profile if it is missing.
+
+        Only for write paths; read-only pages use ``get_guardian`` so a GET never inserts rows.
+        """
+        guardian = self.get_guardian()
+        if guardian is None:
+            guardian, _ = Guardian.objects.get_or_create(user=self.request.user)
+            # Refresh the reverse one-to-one cache so later accesses skip the query
+            self.request.user.guardian = guardian
+            self._guardian = guardian
+        return guardian
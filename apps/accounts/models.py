@@ -3,8 +3,11 @@ Account models for School Hub.
 Includes custom User model and Guardian profile.
 """
 
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import AbstractUser, BaseUserManager
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 
 from apps.core.models import BaseModel
 
@@ -17,9 +20,8 @@ class UserManager(BaseUserManager):
         if not email:
             raise ValueError("O email é obrigatório")
         email = self.normalize_email(email)
-        user = self.model(email=email, **extra_fields)
-        user.set_password(password)
-        user.save(using=self._db)
+        user = self.model(email=email, password=make_password(password), **extra_fields)
+        user.save(force_insert=True, using=self._db)
         return user
 
     def create_superuser(self, email: str, password: str | None = None, **extra_fields):
@@ -77,6 +79,14 @@ class User(AbstractUser):
         verbose_name = "Usuário"
         verbose_name_plural = "Usuários"
         ordering = ["first_name", "last_name"]
+        # Trigram indexes serving the admin's case-insensitive search
+        indexes = [
+            GinIndex(OpClass(Upper("email"), name="gin_trgm_ops"), name="user_email_trgm"),
+            GinIndex(
+                OpClass(Upper("first_name"), name="gin_trgm_ops"), name="user_first_name_trgm"
+            ),
+            GinIndex(OpClass(Upper("last_name"), name="gin_trgm_ops"), name="user_last_name_trgm"),
+        ]
 
     def __str__(self) -> str:
         return self.get_full_name() or self.email
@@ -130,6 +140,9 @@ class Guardian(BaseModel):
         verbose_name = "Responsável"
         verbose_name_plural = "Responsáveis"
         ordering = ["user__first_name", "user__last_name"]
+        indexes = [
+            GinIndex(OpClass(Upper("cpf"), name="gin_trgm_ops"), name="guardian_cpf_trgm"),
+        ]
 
     def __str__(self) -> str:
         return str(self.user)
@@ -6,6 +6,7 @@ from django.contrib import messages
 from django.contrib.auth import login
 from django.contrib.auth import views as auth_views
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.db import transaction
 from django.http import JsonResponse
 from django.shortcuts import redirect
 from django.urls import reverse_lazy
@@ -32,55 +33,73 @@ class RegisterView(CreateView):
     template_name = "accounts/register.html"
     form_class = RegisterForm
     success_url = reverse_lazy("dashboard:index")
+    # Columns read by the registration template and the membership insert
+    pending_class_fields = ("id", "name", "school")
 
     def get(self, request, *args, **kwargs):
-        """Store class code in session if provided."""
+        """Store the invited class in session if a class code is provided."""
         class_code = request.GET.get("class_code")
         if class_code:
             # Verify the class exists
-            if SchoolClass.objects.filter(invite_code=class_code, is_active=True).exists():
-                request.session["pending_class_code"] = class_code
+            school_class = (
+                SchoolClass.objects.filter(invite_code=class_code, is_active=True)
+                .only(*self.pending_class_fields)
+                .first()
+            )
+            if school_class:
+                request.session["pending_class_id"] = str(school_class.pk)
+                self._pending_class = school_class
             else:
                 messages.warning(request, "Código de turma inválido ou turma não encontrada.")
         return super().get(request, *args, **kwargs)
 
+    def _resolve_pending_class(self):
+        """Return the class pending in session, fetching it at most once per request."""
+        if not hasattr(self, "_pending_class"):
+            class_id = self.request.session.get("pending_class_id")
+            self._pending_class = (
+                SchoolClass.objects.filter(pk=class_id, is_active=True)
+                .only(*self.pending_class_fields)
+                .first()
+                if class_id
+                else None
+            )
+        return self._pending_class
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         # Show pending class info if available
-        class_code = self.request.session.get("pending_class_code")
-        if class_code:
-            school_class = SchoolClass.objects.filter(
-                invite_code=class_code, is_active=True
-            ).first()
-            context["pending_class"] = school_class
+        context["pending_class"] = self._resolve_pending_class()
         return context
 
     def form_valid(self, form):
         """Create user and guardian profile, then log in."""
-        user = form.save()
+        # Check if there's a pending class to join
+        school_class = self._resolve_pending_class()
 
-        # Create guardian profile
-        guardian = Guardian.objects.create(user=user)
+        with transaction.atomic():
+            user = form.save()
+
+            # Create guardian profile
+            guardian = Guardian.objects.create(user=user)
 
-        # Check if there's a pending class to join
-        class_code = self.request.session.pop("pending_class_code", None)
-        if class_code:
-            school_class = SchoolClass.objects.filter(
-                invite_code=class_code, is_active=True
-            ).first()
             if school_class:
-                ClassMember.objects.get_or_create(
+                # The guardian was just created, so the membership cannot exist yet
+                ClassMember.objects.create(
                     school_class=school_class,
                     guardian=guardian,
-                    defaults={"role": ClassMember.Role.MEMBER},
-                )
-                messages.success(
-                    self.request,
-                    f"Você foi adicionado à turma '{school_class.name}'!",
+                    role=ClassMember.Role.MEMBER,
                 )
 
-        # Log in the user
-        login(self.request, user)
+        self.request.session.pop("pending_class_id", None)
+        if school_class:
+            messages.success(
+                self.request,
+                f"Você foi adicionado à turma '{school_class.name}'!",
+            )
+
+        # Log in the user; the backend must be named since more than one is configured
+        login(self.request, user, backend="apps.accounts.backends.GuardianModelBackend")
 
         messages.success(
             self.request,
@@ -110,28 +129,39 @@ class ProfileUpdateView(LoginRequiredMixin, UpdateView):
     def get_object(self):
         return self.request.user
 
+    def get_guardian_form(self):
+        """Return the guardian profile form, built once per request."""
+        if not hasattr(self, "_guardian_form"):
+            guardian = getattr(self.request.user, "guardian", None)
+            self._guardian_form = None
+            if guardian:
+                data = self.request.POST if self.request.method == "POST" else None
+                self._guardian_form = GuardianProfileForm(data, instance=guardian)
+        return self._guardian_form
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        guardian = getattr(self.request.user, "guardian", None)
-        if guardian:
-            if self.request.POST:
-                context["guardian_form"] = GuardianProfileForm(self.request.POST, instance=guardian)
-            else:
-                context["guardian_form"] = GuardianProfileForm(instance=guardian)
+        guardian_form = self.get_guardian_form()
+        if guardian_form is not None:
+            context["guardian_form"] = guardian_form
         return context
 
     def form_valid(self, form):
-        response = super().form_valid(form)
+        guardian_form = self.get_guardian_form()
+        if guardian_form is not None and not guardian_form.is_valid():
+            return self.form_invalid(form)
+
+        with transaction.atomic():
+            self.object = form.save(commit=False)
+            self.object.save(update_fields=form.Meta.fields)
 
-        # Update guardian profile if exists
-        guardian = getattr(self.request.user, "guardian", None)
-        if guardian:
-            guardian_form = GuardianProfileForm(self.request.POST, instance=guardian)
-            if guardian_form.is_valid():
-                guardian_form.save()
+            # Update guardian profile if exists
+            if guardian_form is not None:
+                guardian = guardian_form.save(commit=False)
+                guardian.save(update_fields=[*guardian_form.Meta.fields, "updated_at"])
 
         messages.success(self.request, "Perfil atualizado com sucesso!")
-        return response
+        return redirect(self.get_success_url())
 
 
 class PixInfoView(LoginRequiredMixin, View):
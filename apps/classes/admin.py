@@ -3,6 +3,7 @@ Admin configuration for classes app.
 """
 
 from django.contrib import admin
+from django.db.models import Count
 from unfold.admin import ModelAdmin, TabularInline
 
 from .models import ClassInvitation, ClassMember, SchoolClass, Student
@@ -47,13 +48,23 @@ class SchoolClassAdmin(ModelAdmin):
         ),
     )
 
-    @admin.display(description="Membros")
+    def get_queryset(self, request):
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(
+                _member_count=Count("members", distinct=True),
+                _student_count=Count("students", distinct=True),
+            )
+        )
+
+    @admin.display(description="Membros", ordering="_member_count")
     def member_count(self, obj):
-        return obj.member_count
+        return obj._member_count
 
-    @admin.display(description="Alunos")
+    @admin.display(description="Alunos", ordering="_student_count")
     def student_count(self, obj):
-        return obj.student_count
+        return obj._student_count
 
 
 @admin.register(ClassMember)
@@ -61,6 +72,8 @@ class ClassMemberAdmin(ModelAdmin):
     """Admin configuration for ClassMember model."""
 
     list_display = ["guardian", "school_class", "role", "joined_at"]
+    list_select_related = ["guardian__user", "school_class"]
+    ordering = ["guardian__user__first_name"]
     list_filter = ["role", "school_class"]
     search_fields = ["guardian__user__first_name", "guardian__user__last_name"]
     autocomplete_fields = ["guardian", "school_class"]
@@ -71,6 +84,7 @@ class StudentAdmin(ModelAdmin):
     """Admin configuration for Student model."""
 
     list_display = ["name", "school_class", "guardian", "birth_date"]
+    list_select_related = ["guardian__user", "school_class"]
     list_filter = ["school_class"]
     search_fields = ["name", "guardian__user__first_name"]
     autocomplete_fields = ["guardian", "school_class"]
@@ -95,7 +109,7 @@ class StudentAdmin(ModelAdmin):
 class ClassInvitationAdmin(ModelAdmin):
     """Admin configuration for ClassInvitation model."""
 
-    list_display = ["school_class", "email", "status", "invited_by", "expires_at"]
+    list_display = ["school_class", "email", "status", "is_valid", "invited_by", "expires_at"]
     list_filter = ["status", "school_class"]
     search_fields = ["email", "school_class__name"]
     readonly_fields = ["token", "accepted_at", "accepted_by"]
@@ -115,3 +129,10 @@ class ClassInvitationAdmin(ModelAdmin):
             {"fields": ("accepted_at", "accepted_by")},
         ),
     )
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_validity()
+
+    @admin.display(description="Válido", boolean=True, ordering="valid_now")
+    def is_valid(self, obj):
+        return obj.is_valid
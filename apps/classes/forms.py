@@ -4,6 +4,15 @@ Forms for classes app.
 
 from django import forms
 
+from apps.core.form_widgets import (
+    date_input,
+    datetime_input,
+    email_input,
+    number_input,
+    text_input,
+    textarea,
+)
+
 from .models import ClassInvitation, SchoolClass, Student
 
 
@@ -14,30 +23,10 @@ class ClassForm(forms.ModelForm):
         model = SchoolClass
         fields = ["name", "school", "year", "description"]
         widgets = {
-            "name": forms.TextInput(
-                attrs={
-                    "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                    "placeholder": "Ex: 3º Ano A",
-                }
-            ),
-            "school": forms.TextInput(
-                attrs={
-                    "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                    "placeholder": "Nome da escola",
-                }
-            ),
-            "year": forms.NumberInput(
-                attrs={
-                    "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                }
-            ),
-            "description": forms.Textarea(
-                attrs={
-                    "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                    "rows": 3,
-                    "placeholder": "Descrição da turma (opcional)",
-                }
-            ),
+            "name": text_input("Ex: 3º Ano A"),
+            "school": text_input("Nome da escola"),
+            "year": number_input(),
+            "description": textarea("Descrição da turma (opcional)"),
         }
 
 
@@ -48,25 +37,9 @@ class StudentForm(forms.ModelForm):
         model = Student
         fields = ["name", "birth_date", "notes"]
         widgets = {
-            "name": forms.TextInput(
-                attrs={
-                    "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                    "placeholder": "Nome completo do aluno",
-                }
-            ),
-            "birth_date": forms.DateInput(
-                attrs={
-                    "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                    "type": "date",
-                }
-            ),
-            "notes": forms.Textarea(
-                attrs={
-                    "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                    "rows": 3,
-                    "placeholder": "Observações importantes (alergias, restrições, etc.)",
-                }
-            ),
+            "name": text_input("Nome completo do aluno"),
+            "birth_date": date_input(),
+            "notes": textarea("Observações importantes (alergias, restrições, etc.)"),
         }
 
 
@@ -77,18 +50,8 @@ class InvitationForm(forms.ModelForm):
         model = ClassInvitation
         fields = ["email", "expires_at"]
         widgets = {
-            "email": forms.EmailInput(
-                attrs={
-                    "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                    "placeholder": "E-mail do convidado (opcional)",
-                }
-            ),
-            "expires_at": forms.DateTimeInput(
-                attrs={
-                    "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                    "type": "datetime-local",
-                }
-            ),
+            "email": email_input("E-mail do convidado (opcional)"),
+            "expires_at": datetime_input(),
         }
 
 
@@ -98,10 +61,5 @@ class JoinClassForm(forms.Form):
     invite_code = forms.CharField(
         label="Código de Convite",
         max_length=20,
-        widget=forms.TextInput(
-            attrs={
-                "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                "placeholder": "Digite o código de convite",
-            }
-        ),
+        widget=text_input("Digite o código de convite"),
     )
@@ -0,0 +1,21 @@
+# Generated by Django 5.1.15 on 2026-10-14 03:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('classes', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='classmember',
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name='classmember',
+            constraint=models.UniqueConstraint(fields=('school_class', 'guardian'), name='uniq_classmember'),
+        ),
+    ]
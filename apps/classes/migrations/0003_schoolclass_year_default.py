@@ -0,0 +1,19 @@
+# Generated by Django 5.1.15 on 2026-10-14 04:03
+
+import apps.classes.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('classes', '0002_classmember_unique_constraint'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='schoolclass',
+            name='year',
+            field=models.PositiveIntegerField(default=apps.classes.models._current_year, verbose_name='Ano Letivo'),
+        ),
+    ]
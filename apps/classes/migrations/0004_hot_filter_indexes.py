@@ -0,0 +1,22 @@
+# Generated by Django 5.1.15 on 2026-10-14 04:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_search_trigram_indexes'),
+        ('classes', '0003_schoolclass_year_default'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='classinvitation',
+            index=models.Index(fields=['status', 'expires_at'], name='invitation_status_expiry_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='classmember',
+            index=models.Index(fields=['school_class', 'role'], name='classmember_class_role_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.15 on 2026-10-14 04:07
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('classes', '0005_uuid7_primary_keys'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='classmember',
+            options={'ordering': [], 'verbose_name': 'Membro da Turma', 'verbose_name_plural': 'Membros da Turma'},
+        ),
+    ]
@@ -4,12 +4,21 @@ Models for school classes, students, and class membership.
 
 import secrets
 
-from django.db import models
+from django.db import IntegrityError, models, transaction
+from django.db.models import BooleanField, ExpressionWrapper, Q
+from django.db.models.functions import Now
 from django.utils import timezone
 
 from apps.accounts.models import Guardian
 from apps.core.models import BaseModel
 
+INVITE_CODE_ATTEMPTS = 5
+
+
+def _current_year() -> int:
+    """Return the current year, evaluated when a class is created."""
+    return timezone.now().year
+
 
 class SchoolClass(BaseModel):
     """
@@ -29,7 +38,7 @@ class SchoolClass(BaseModel):
     )
     year = models.PositiveIntegerField(
         "Ano Letivo",
-        default=timezone.now().year,
+        default=_current_year,
     )
     description = models.TextField(
         "Descrição",
@@ -55,39 +64,85 @@ class SchoolClass(BaseModel):
         return f"{self.name} ({self.year})"
 
     def save(self, *args, **kwargs):
-        if not self.invite_code:
+        if self.invite_code:
+            super().save(*args, **kwargs)
+        else:
+            self._save_with_new_invite_code(*args, **kwargs)
+
+    def _save_with_new_invite_code(self, *args, **kwargs):
+        """Save with a fresh invite code, retrying on the rare unique collision."""
+        self._retry_invite_code(lambda: super(SchoolClass, self).save(*args, **kwargs))
+
+    def _retry_invite_code(self, write) -> None:
+        """Run write() with fresh invite codes until one is accepted."""
+        for attempt in range(INVITE_CODE_ATTEMPTS):
             self.invite_code = self._generate_invite_code()
-        super().save(*args, **kwargs)
-
-    def _generate_invite_code(self) -> str:
-        """Generate a unique invite code."""
-        while True:
-            code = secrets.token_urlsafe(8)[:10].upper()
-            if not SchoolClass.objects.filter(invite_code=code).exists():
-                return code
+            try:
+                # Savepoint so a collision doesn't break an outer transaction
+                with transaction.atomic():
+                    write()
+                return
+            except IntegrityError:
+                if attempt == INVITE_CODE_ATTEMPTS - 1:
+                    raise
+
+    @staticmethod
+    def _generate_invite_code() -> str:
+        """Generate a random invite code; uniqueness is enforced by the database."""
+        return secrets.token_urlsafe(8)[:10].upper()
 
     def regenerate_invite_code(self) -> str:
         """Regenerate the invite code."""
-        self.invite_code = self._generate_invite_code()
-        self.save(update_fields=["invite_code", "updated_at"])
+        self.updated_at = timezone.now()
+        self._retry_invite_code(
+            lambda: SchoolClass.objects.filter(pk=self.pk).update(
+                invite_code=self.invite_code, updated_at=self.updated_at
+            )
+        )
         return self.invite_code
 
     @property
     def member_count(self) -> int:
         """Return the number of members in this class."""
+        count = getattr(self, "members_count", None)
+        if count is not None:
+            return count
         return self.members.count()
 
     @property
     def student_count(self) -> int:
         """Return the number of students in this class."""
+        count = getattr(self, "students_count", None)
+        if count is not None:
+            return count
         return self.students.count()
 
     @property
     def active_events_count(self) -> int:
         """Return the number of active events."""
+        count = getattr(self, "active_events_total", None)
+        if count is not None:
+            return count
         return self.events.filter(is_active=True).count()
 
 
+class ClassMemberManager(models.Manager):
+    """Manager with membership helpers that lean on the unique constraint."""
+
+    def add(self, school_class: SchoolClass, guardian: Guardian, role: str | None = None):
+        """Add a guardian to a class, returning (membership, created)."""
+        member = self.model(
+            school_class=school_class,
+            guardian=guardian,
+            role=role or self.model.Role.MEMBER,
+        )
+        # INSERT ... ON CONFLICT DO NOTHING; the UUID is generated client-side,
+        # so the row read back only carries our pk if this insert won
+        self.bulk_create([member], ignore_conflicts=True)
+        stored = self.get(school_class=school_class, guardian=guardian)
+        return stored, stored.pk == member.pk
+
+
 class ClassMember(BaseModel):
     """
     Represents a guardian's membership in a class.
@@ -121,11 +176,22 @@ class ClassMember(BaseModel):
         auto_now_add=True,
     )
 
+    objects = ClassMemberManager()
+
     class Meta:
         verbose_name = "Membro da Turma"
         verbose_name_plural = "Membros da Turma"
-        unique_together = ["school_class", "guardian"]
-        ordering = ["guardian__user__first_name"]
+        # No default ordering: sorting by name would join guardian and user on every query
+        ordering = []
+        constraints = [
+            models.UniqueConstraint(
+                fields=["school_class", "guardian"],
+                name="uniq_classmember",
+            ),
+        ]
+        indexes = [
+            models.Index(fields=["school_class", "role"], name="classmember_class_role_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.guardian} - {self.school_class}"
@@ -178,6 +244,23 @@ class Student(BaseModel):
         return self.name
 
 
+class ClassInvitationQuerySet(models.QuerySet):
+    """QuerySet that evaluates invitation validity in the database."""
+
+    def _valid_q(self) -> Q:
+        return Q(status=self.model.Status.PENDING, expires_at__gt=Now())
+
+    def valid(self):
+        """Return only pending, unexpired invitations."""
+        return self.filter(self._valid_q())
+
+    def with_validity(self):
+        """Annotate each invitation with whether it can still be accepted."""
+        return self.annotate(
+            valid_now=ExpressionWrapper(self._valid_q(), output_field=BooleanField())
+        )
+
+
 class ClassInvitation(BaseModel):
     """
     Represents an invitation to join a class.
@@ -237,10 +320,15 @@ class ClassInvitation(BaseModel):
         verbose_name="Aceito por",
     )
 
+    objects = ClassInvitationQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Convite"
         verbose_name_plural = "Convites"
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(fields=["status", "expires_at"], name="invitation_status_expiry_idx"),
+        ]
 
     def __str__(self) -> str:
         if self.email:
@@ -262,6 +350,9 @@ class ClassInvitation(BaseModel):
     @property
     def is_valid(self) -> bool:
         """Check if the invitation is still valid."""
+        valid = getattr(self, "valid_now", None)
+        if valid is not None:
+            return valid
         return self.status == self.Status.PENDING and not self.is_expired
 
     def accept(self, guardian: Guardian) -> ClassMember:
@@ -270,16 +361,19 @@ class ClassInvitation(BaseModel):
             raise ValueError("Este convite não é mais válido.")
 
         # Create membership
-        member, created = ClassMember.objects.get_or_create(
-            school_class=self.school_class,
-            guardian=guardian,
-            defaults={"role": ClassMember.Role.MEMBER},
-        )
+        member, _ = ClassMember.objects.add(self.school_class, guardian)
 
-        # Update invitation status
+        # Update invitation status with a single UPDATE, keeping self in sync
+        now = timezone.now()
         self.status = self.Status.ACCEPTED
-        self.accepted_at = timezone.now()
+        self.accepted_at = now
         self.accepted_by = guardian
-        self.save(update_fields=["status", "accepted_at", "accepted_by", "updated_at"])
+        self.updated_at = now
+        ClassInvitation.objects.filter(pk=self.pk).update(
+            status=self.status,
+            accepted_at=now,
+            accepted_by=guardian,
+            updated_at=now,
+        )
 
         return member
@@ -0,0 +1,81 @@
+"""
+Tests for the class views.
+"""
+
+from datetime import date, timedelta
+from itertools import count
+
+from django.test import TestCase
+from django.urls import reverse
+
+from apps.accounts.models import Guardian, User
+from apps.classes.models import ClassMember, SchoolClass, Student
+from apps.events.models import Event
+
+_emails = count()
+
+
+def _add_guardian(email: str) -> Guardian:
+    user = User.objects.create_user(email=email, password="senha-teste", first_name="Teste")
+    return Guardian.objects.create(user=user)
+
+
+def _fill_class(school_class: SchoolClass, size: int) -> None:
+    """Add `size` members, students and upcoming events to the class."""
+    for i in range(size):
+        guardian = _add_guardian(f"membro-{next(_emails)}@example.com")
+        ClassMember.objects.create(school_class=school_class, guardian=guardian)
+        Student.objects.create(name=f"Aluno {i}", school_class=school_class, guardian=guardian)
+        Event.objects.create(
+            school_class=school_class,
+            title=f"Evento {i}",
+            event_date=date.today() + timedelta(days=i + 1),
+        )
+
+
+class ClassViewQueryCountTests(TestCase):
+    """The list and detail pages run a fixed number of queries however large a class is."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.guardian = _add_guardian("admin@example.com")
+        cls.classes = []
+        for name in ("A", "B", "C"):
+            school_class = SchoolClass.objects.create(name=name, school="Escola Teste")
+            ClassMember.objects.create(
+                school_class=school_class,
+                guardian=cls.guardian,
+                role=ClassMember.Role.ADMIN,
+            )
+            _fill_class(school_class, 3)
+            cls.classes.append(school_class)
+
+    def setUp(self):
+        self.client.force_login(self.guardian.user)
+
+    def test_list_queries(self):
+        # session, user + guardian, paginator count, classes with their counts
+        with self.assertNumQueries(4):
+            response = self.client.get(reverse("classes:list"))
+        self.assertEqual(response.status_code, 200)
+
+        _fill_class(self.classes[0], 2)
+        with self.assertNumQueries(4):
+            response = self.client.get(reverse("classes:list"))
+        counts = {c.name: (c.member_count, c.student_count) for c in response.context["classes"]}
+        self.assertEqual(counts, {"A": (6, 5), "B": (4, 3), "C": (4, 3)})
+
+    def test_detail_queries(self):
+        url = reverse("classes:detail", kwargs={"pk": self.classes[0].pk})
+        # session, user + guardian, class, members, students, recent events
+        with self.assertNumQueries(6):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+        _fill_class(self.classes[0], 2)
+        with self.assertNumQueries(6):
+            response = self.client.get(url)
+        school_class = response.context["school_class"]
+        self.assertEqual(school_class.member_count, 6)
+        self.assertEqual(school_class.student_count, 5)
+        self.assertEqual(school_class.active_events_count, 5)
@@ -5,8 +5,10 @@ Views for classes app.
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.db import transaction
-from django.shortcuts import get_object_or_404, redirect
-from django.urls import reverse_lazy
+from django.db.models import Count, Exists, IntegerField, OuterRef, Prefetch, Subquery
+from django.db.models.functions import Coalesce
+from django.shortcuts import get_object_or_404, redirect, render
+from django.urls import reverse, reverse_lazy
 from django.views.generic import (
     CreateView,
     DeleteView,
@@ -17,13 +19,44 @@ from django.views.generic import (
     View,
 )
 
-from apps.accounts.models import Guardian
+from apps.accounts.mixins import GuardianRequiredMixin
+from apps.events.models import Event
 
 from .forms import ClassForm, InvitationForm, JoinClassForm, StudentForm
 from .models import ClassInvitation, ClassMember, SchoolClass, Student
 
 
-class ClassListView(LoginRequiredMixin, ListView):
+def _count_per_class(queryset) -> Coalesce:
+    """Correlated COUNT of ``queryset`` rows in the outer class.
+
+    Unlike ``Count`` over several joined relations, each count is computed on its own
+    instead of over the members x students x events cross product.
+    """
+    counts = (
+        queryset.filter(school_class=OuterRef("pk"))
+        .order_by()
+        .values("school_class")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    return Coalesce(Subquery(counts, output_field=IntegerField()), 0)
+
+
+class SchoolClassFromURLMixin:
+    """Fetch the class referenced by the URL once per request."""
+
+    class_kwarg = "class_id"
+
+    def get_school_class(self):
+        if not hasattr(self, "_school_class"):
+            self._school_class = get_object_or_404(
+                SchoolClass.objects.only("id", "name", "invite_code"),
+                pk=self.kwargs[self.class_kwarg],
+            )
+        return self._school_class
+
+
+class ClassListView(GuardianRequiredMixin, ListView):
     """List all classes the user is a member of."""
 
     model = SchoolClass
@@ -32,49 +65,85 @@ class ClassListView(LoginRequiredMixin, ListView):
     paginate_by = 12
 
     def get_queryset(self):
-        guardian = getattr(self.request.user, "guardian", None)
-        if guardian:
-            return SchoolClass.objects.filter(
-                members__guardian=guardian,
-                is_active=True,
-            ).distinct()
-        return SchoolClass.objects.none()
+        guardian = self.get_guardian()
+        if guardian is None:
+            return SchoolClass.objects.none()
+
+        # EXISTS keeps one row per class without a membership join to deduplicate
+        is_member = Exists(
+            ClassMember.objects.filter(school_class=OuterRef("pk"), guardian=guardian)
+        )
+        return (
+            SchoolClass.objects.filter(is_member, is_active=True)
+            .annotate(
+                members_count=_count_per_class(ClassMember.objects.all()),
+                students_count=_count_per_class(Student.objects.all()),
+                active_events_total=_count_per_class(Event.objects.filter(is_active=True)),
+            )
+            .only("id", "name", "school", "year")
+            .order_by("-year", "name")
+        )
 
 
-class ClassDetailView(LoginRequiredMixin, DetailView):
+class ClassDetailView(GuardianRequiredMixin, DetailView):
     """View class details."""
 
     model = SchoolClass
     template_name = "classes/class_detail.html"
     context_object_name = "school_class"
 
+    def get_queryset(self):
+        # Member and student counts come from the prefetched lists in get_context_data
+        return SchoolClass.objects.annotate(
+            active_events_total=_count_per_class(Event.objects.filter(is_active=True)),
+        ).prefetch_related(
+            Prefetch(
+                "members",
+                queryset=ClassMember.objects.select_related("guardian__user").order_by(
+                    "guardian__user__first_name"
+                ),
+            ),
+            Prefetch(
+                "students",
+                queryset=Student.objects.select_related("guardian__user").order_by("name"),
+            ),
+            Prefetch(
+                "events",
+                queryset=Event.objects.filter(is_active=True)
+                .with_collected_total()
+                .order_by("-event_date")[:5],
+                to_attr="recent_events",
+            ),
+        )
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        guardian = getattr(self.request.user, "guardian", None)
+        guardian = self.get_guardian()
+        members = self.object.members.all()
+        students = self.object.students.all()
+        self.object.members_count = len(members)
+        self.object.students_count = len(students)
 
         context["is_member"] = False
         context["is_admin"] = False
         context["my_students"] = []
 
-        if guardian:
-            membership = self.object.members.filter(guardian=guardian).first()
+        # Resolved from the prefetched rows instead of extra queries
+        if guardian is not None:
+            membership = next((m for m in members if m.guardian_id == guardian.pk), None)
             if membership:
                 context["is_member"] = True
                 context["is_admin"] = membership.is_admin
-                context["my_students"] = self.object.students.filter(guardian=guardian)
+                context["my_students"] = [s for s in students if s.guardian_id == guardian.pk]
 
-        context["members"] = self.object.members.select_related(
-            "guardian__user"
-        ).order_by("guardian__user__first_name")
-        context["students"] = self.object.students.select_related(
-            "guardian__user"
-        ).order_by("name")
-        context["events"] = self.object.events.filter(is_active=True).order_by("-event_date")[:5]
+        context["members"] = members
+        context["students"] = students
+        context["events"] = self.object.recent_events
 
         return context
 
 
-class ClassCreateView(LoginRequiredMixin, CreateView):
+class ClassCreateView(GuardianRequiredMixin, CreateView):
     """Create a new class."""
 
     model = SchoolClass
@@ -82,12 +151,9 @@ class ClassCreateView(LoginRequiredMixin, CreateView):
     template_name = "classes/class_form.html"
 
     def form_valid(self, form):
-        guardian = getattr(self.request.user, "guardian", None)
-        if not guardian:
-            Guardian.objects.create(user=self.request.user)
-            guardian = self.request.user.guardian
-
+        # Guardian, class and admin membership are written or rolled back together
         with transaction.atomic():
+            guardian = self.get_or_create_guardian()
             self.object = form.save()
             # Add creator as admin
             ClassMember.objects.create(
@@ -119,7 +185,7 @@ class ClassUpdateView(LoginRequiredMixin, UpdateView):
         return super().form_valid(form)
 
 
-class StudentCreateView(LoginRequiredMixin, CreateView):
+class StudentCreateView(GuardianRequiredMixin, SchoolClassFromURLMixin, CreateView):
     """Add a student to a class."""
 
     model = Student
@@ -128,14 +194,12 @@ class StudentCreateView(LoginRequiredMixin, CreateView):
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["school_class"] = get_object_or_404(
-            SchoolClass, pk=self.kwargs["class_id"]
-        )
+        context["school_class"] = self.get_school_class()
         return context
 
     def form_valid(self, form):
-        guardian = getattr(self.request.user, "guardian", None)
-        school_class = get_object_or_404(SchoolClass, pk=self.kwargs["class_id"])
+        guardian = self.get_or_create_guardian()
+        school_class = self.get_school_class()
 
         self.object = form.save(commit=False)
         self.object.guardian = guardian
@@ -146,7 +210,7 @@ class StudentCreateView(LoginRequiredMixin, CreateView):
         return redirect("classes:detail", pk=school_class.pk)
 
 
-class StudentUpdateView(LoginRequiredMixin, UpdateView):
+class StudentUpdateView(GuardianRequiredMixin, UpdateView):
     """Update student details."""
 
     model = Student
@@ -154,8 +218,7 @@ class StudentUpdateView(LoginRequiredMixin, UpdateView):
     template_name = "classes/student_form.html"
 
     def get_queryset(self):
-        guardian = getattr(self.request.user, "guardian", None)
-        return Student.objects.filter(guardian=guardian)
+        return Student.objects.select_related("school_class").filter(guardian=self.get_guardian())
 
     def get_success_url(self):
         return reverse_lazy("classes:detail", kwargs={"pk": self.object.school_class.pk})
@@ -165,15 +228,14 @@ class StudentUpdateView(LoginRequiredMixin, UpdateView):
         return super().form_valid(form)
 
 
-class StudentDeleteView(LoginRequiredMixin, DeleteView):
+class StudentDeleteView(GuardianRequiredMixin, DeleteView):
     """Delete a student."""
 
     model = Student
     template_name = "classes/student_confirm_delete.html"
 
     def get_queryset(self):
-        guardian = getattr(self.request.user, "guardian", None)
-        return Student.objects.filter(guardian=guardian)
+        return Student.objects.select_related("school_class").filter(guardian=self.get_guardian())
 
     def get_success_url(self):
         return reverse_lazy("classes:detail", kwargs={"pk": self.object.school_class.pk})
@@ -183,47 +245,70 @@ class StudentDeleteView(LoginRequiredMixin, DeleteView):
         return super().form_valid(form)
 
 
-class AcceptInvitationView(LoginRequiredMixin, View):
+class AcceptInvitationView(GuardianRequiredMixin, View):
     """Accept a class invitation."""
 
+    template_name = "classes/accept_invitation.html"
+
     def get(self, request, token):
-        invitation = get_object_or_404(ClassInvitation, token=token)
+        # Read-only, so link previews don't consume the invitation
+        invitation = get_object_or_404(
+            ClassInvitation.objects.select_related("school_class").only(
+                "id", "status", "expires_at", "school_class__name"
+            ),
+            token=token,
+        )
 
         if not invitation.is_valid:
             messages.error(request, "Este convite não é mais válido.")
             return redirect("classes:list")
 
-        guardian = getattr(request.user, "guardian", None)
-        if not guardian:
-            guardian = Guardian.objects.create(user=request.user)
+        return render(request, self.template_name, {"invitation": invitation})
 
-        try:
-            invitation.accept(guardian)
-            messages.success(
-                request,
-                f'Você agora faz parte da turma "{invitation.school_class.name}"!',
+    def post(self, request, token):
+        guardian = self.get_or_create_guardian()
+
+        with transaction.atomic():
+            # Lock only the invitation row so concurrent clicks accept it once
+            invitation = get_object_or_404(
+                ClassInvitation.objects.select_related("school_class").select_for_update(
+                    of=("self",)
+                ),
+                token=token,
             )
-        except ValueError as e:
-            messages.error(request, str(e))
 
-        return redirect("classes:detail", pk=invitation.school_class.pk)
+            if not invitation.is_valid:
+                messages.error(request, "Este convite não é mais válido.")
+                return redirect("classes:list")
 
+            try:
+                invitation.accept(guardian)
+                messages.success(
+                    request,
+                    f'Você agora faz parte da turma "{invitation.school_class.name}"!',
+                )
+            except ValueError as e:
+                messages.error(request, str(e))
 
-class CreateInvitationView(LoginRequiredMixin, CreateView):
+        return redirect("classes:detail", pk=invitation.school_class_id)
+
+
+class CreateInvitationView(GuardianRequiredMixin, SchoolClassFromURLMixin, CreateView):
     """Create a class invitation."""
 
     model = ClassInvitation
     form_class = InvitationForm
     template_name = "classes/invitation_form.html"
+    class_kwarg = "pk"
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
-        context["school_class"] = get_object_or_404(SchoolClass, pk=self.kwargs["pk"])
+        context["school_class"] = self.get_school_class()
         return context
 
     def form_valid(self, form):
-        school_class = get_object_or_404(SchoolClass, pk=self.kwargs["pk"])
-        guardian = getattr(self.request.user, "guardian", None)
+        school_class = self.get_school_class()
+        guardian = self.get_guardian()
 
         self.object = form.save(commit=False)
         self.object.school_class = school_class
@@ -231,7 +316,7 @@ class CreateInvitationView(LoginRequiredMixin, CreateView):
         self.object.save()
 
         invite_url = self.request.build_absolute_uri(
-            reverse_lazy("classes:accept_invitation", kwargs={"token": self.object.token})
+            reverse("classes:accept_invitation", kwargs={"token": self.object.token})
         )
 
         messages.success(
@@ -241,7 +326,7 @@ class CreateInvitationView(LoginRequiredMixin, CreateView):
         return redirect("classes:detail", pk=school_class.pk)
 
 
-class JoinClassView(LoginRequiredMixin, FormView):
+class JoinClassView(GuardianRequiredMixin, FormView):
     """Join a class using invite code."""
 
     form_class = JoinClassForm
@@ -256,15 +341,9 @@ class JoinClassView(LoginRequiredMixin, FormView):
             messages.error(self.request, "Código de convite inválido.")
             return self.form_invalid(form)
 
-        guardian = getattr(self.request.user, "guardian", None)
-        if not guardian:
-            guardian = Guardian.objects.create(user=self.request.user)
+        guardian = self.get_or_create_guardian()
 
-        membership, created = ClassMember.objects.get_or_create(
-            school_class=school_class,
-            guardian=guardian,
-            defaults={"role": ClassMember.Role.MEMBER},
-        )
+        _, created = ClassMember.objects.add(school_class, guardian)
 
         if created:
             messages.success(
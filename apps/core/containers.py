@@ -4,34 +4,38 @@ Uses dependency-injector for IoC container management.
 """
 
 from dependency_injector import containers, providers
+from django.conf import settings
 
-from apps.core.services.pix import PixService, PixServiceInterface
+from apps.core.services.pix import PixService, PixServiceInterface, get_pix_service
+
+
+def _setting(name: str) -> str:
+    """Read an optional string setting."""
+    return getattr(settings, name, "")
 
 
 class CoreContainer(containers.DeclarativeContainer):
     """Container for core services."""
 
-    config = providers.Configuration()
-
-    # PIX Service
+    # PIX Service (settings are read once, when the singleton is first built)
     pix_service: providers.Provider[PixServiceInterface] = providers.Singleton(
         PixService,
-        pix_key=config.pix_key,
-        merchant_name=config.pix_merchant_name,
-        merchant_city=config.pix_merchant_city,
+        pix_key=providers.Callable(_setting, "PIX_KEY"),
+        merchant_name=providers.Callable(_setting, "PIX_MERCHANT_NAME"),
+        merchant_city=providers.Callable(_setting, "PIX_MERCHANT_CITY"),
+    )
+
+    # PIX service for another receiving account (e.g. an event's key), shared per account
+    account_pix_service: providers.Provider[PixServiceInterface] = providers.Callable(
+        get_pix_service
     )
 
 
 class AppContainer(containers.DeclarativeContainer):
     """Main application container."""
 
-    config = providers.Configuration()
-
     # Core container
-    core = providers.Container(
-        CoreContainer,
-        config=config,
-    )
+    core = providers.Container(CoreContainer)
 
 
 # Global container instance
@@ -39,13 +43,12 @@ container = AppContainer()
 
 
 def configure_container():
-    """Configure the container with settings."""
-    from django.conf import settings
-
-    container.config.from_dict(
-        {
-            "pix_key": getattr(settings, "PIX_KEY", ""),
-            "pix_merchant_name": getattr(settings, "PIX_MERCHANT_NAME", ""),
-            "pix_merchant_city": getattr(settings, "PIX_MERCHANT_CITY", ""),
-        }
+    """Bind the PIX service to the values resolved from settings at startup."""
+    container.core.pix_service.override(
+        providers.Singleton(
+            PixService,
+            pix_key=_setting("PIX_KEY"),
+            merchant_name=_setting("PIX_MERCHANT_NAME"),
+            merchant_city=_setting("PIX_MERCHANT_CITY"),
+        )
     )
@@ -0,0 +1,85 @@
+"""
+Shared form widget factories.
+Builds widgets with the default Tailwind styling used across the parents area.
+"""
+
+from types import MappingProxyType
+
+from django import forms
+from django.utils.safestring import mark_safe
+
+INPUT_CLASS = (
+    "w-full px-4 py-3 rounded-lg border border-gray-300 "
+    "focus:ring-2 focus:ring-purple-500 focus:border-transparent"
+)
+
+# Constant markup with no user input, so widget rendering can skip escaping it
+INPUT_CLASS_SAFE = mark_safe(INPUT_CLASS)
+
+# Base attrs for every styled widget (read-only so it can be shared safely)
+INPUT_ATTRS = MappingProxyType({"class": INPUT_CLASS_SAFE})
+
+
+def _attrs(placeholder: str | None, extra: dict) -> dict:
+    attrs: dict[str, str] = dict(INPUT_ATTRS)
+    if placeholder is not None:
+        attrs["placeholder"] = placeholder
+    attrs.update(extra)
+    return attrs
+
+
+def text_input(placeholder: str | None = None, **extra) -> forms.TextInput:
+    """Return a styled text input."""
+    return forms.TextInput(attrs=_attrs(placeholder, extra))
+
+
+def email_input(placeholder: str | None = None, **extra) -> forms.EmailInput:
+    """Return a styled e-mail input."""
+    return forms.EmailInput(attrs=_attrs(placeholder, extra))
+
+
+def password_input(placeholder: str | None = None, **extra) -> forms.PasswordInput:
+    """Return a styled password input."""
+    return forms.PasswordInput(attrs=_attrs(placeholder, extra))
+
+
+def url_input(placeholder: str | None = None, **extra) -> forms.URLInput:
+    """Return a styled URL input."""
+    return forms.URLInput(attrs=_attrs(placeholder, extra))
+
+
+def number_input(placeholder: str | None = None, **extra) -> forms.NumberInput:
+    """Return a styled number input."""
+    return forms.NumberInput(attrs=_attrs(placeholder, extra))
+
+
+def textarea(placeholder: str | None = None, rows: int = 3, **extra) -> forms.Textarea:
+    """Return a styled textarea."""
+    return forms.Textarea(attrs=_attrs(placeholder, {"rows": rows, **extra}))
+
+
+def select(**extra) -> forms.Select:
+    """Return a styled select."""
+    return forms.Select(attrs=_attrs(None, extra))
+
+
+def file_input(**extra) -> forms.FileInput:
+    """Return a styled file input."""
+    return forms.FileInput(attrs=_attrs(None, extra))
+
+
+def date_input(**extra) -> forms.DateInput:
+    """Return a styled native date picker."""
+    return forms.DateInput(attrs=_attrs(None, {"type": "date", **extra}))
+
+
+def datetime_input(**extra) -> forms.DateTimeInput:
+    """Return a styled native datetime picker."""
+    return forms.DateTimeInput(attrs=_attrs(None, {"type": "datetime-local", **extra}))
+
+
+def date_picker_input(placeholder: str | None = None, **extra) -> forms.DateInput:
+    """Return a styled text input enhanced client-side by flatpickr."""
+    attrs = _attrs(placeholder, {"type": "text", **extra})
+    attrs["class"] = f"{INPUT_CLASS} flatpickr-date"
+    return forms.DateInput(format="%Y-%m-%d", attrs=attrs)
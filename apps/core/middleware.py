@@ -0,0 +1,24 @@
+"""
+Request middleware shared across apps.
+"""
+
+from django.conf import settings
+from django.http import HttpResponse
+
+
+class UploadSizeLimitMiddleware:
+    """Reject request bodies above MAX_UPLOAD_REQUEST_SIZE before anything reads them."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.limit = settings.MAX_UPLOAD_REQUEST_SIZE
+
+    def __call__(self, request):
+        try:
+            content_length = int(request.META.get("CONTENT_LENGTH") or 0)
+        except ValueError:
+            content_length = 0
+
+        if content_length > self.limit:
+            return HttpResponse("O arquivo enviado é muito grande.", status=413)
+        return self.get_response(request)
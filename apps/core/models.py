@@ -3,12 +3,25 @@ Base models for the School Hub project.
 Provides abstract base classes with common fields and behaviors.
 """
 
+import secrets
+import time
 import uuid
 
 from django.db import models
 from django.utils import timezone
 
 
+def uuid7() -> uuid.UUID:
+    """
+    Return a time-ordered UUID (RFC 9562 version 7).
+    Keeps new primary keys appending to the end of B-tree indexes.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | secrets.randbits(80)
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
 class TimeStampedModel(models.Model):
     """
     Abstract base model that provides self-updating
@@ -36,7 +49,7 @@ class UUIDModel(models.Model):
 
     id = models.UUIDField(
         primary_key=True,
-        default=uuid.uuid4,
+        default=uuid7,
         editable=False,
     )
 
@@ -55,19 +68,31 @@ class BaseModel(UUIDModel, TimeStampedModel):
         ordering = ["-created_at"]
 
 
-class SoftDeleteManager(models.Manager):
+class SoftDeleteQuerySet(models.QuerySet):
+    """QuerySet with soft-delete filters that chain with other queryset methods."""
+
+    def alive(self):
+        """Return only records that are not soft-deleted."""
+        return self.filter(deleted_at__isnull=True)
+
+    def deleted_only(self):
+        """Return only soft-deleted records."""
+        return self.filter(deleted_at__isnull=False)
+
+
+class SoftDeleteManager(models.Manager.from_queryset(SoftDeleteQuerySet)):
     """Manager that excludes soft-deleted records by default."""
 
     def get_queryset(self):
-        return super().get_queryset().filter(deleted_at__isnull=True)
+        return super().get_queryset().alive()
 
     def with_deleted(self):
         """Return all objects including soft-deleted ones."""
-        return super().get_queryset()
+        return SoftDeleteQuerySet(self.model, using=self._db)
 
     def deleted_only(self):
         """Return only soft-deleted objects."""
-        return super().get_queryset().filter(deleted_at__isnull=False)
+        return self.with_deleted().deleted_only()
 
 
 class SoftDeleteModel(models.Model):
@@ -3,14 +3,69 @@ PIX Payment Service for generating QR codes and payment strings.
 Based on Brazilian Central Bank's PIX EMV specification.
 """
 
+import functools
 import io
 import re
 import unicodedata
+from binascii import crc_hqx
 from dataclasses import dataclass
 from decimal import Decimal
 from typing import Protocol
 
 import qrcode
+from PIL import Image
+
+# Patterns used to normalize PIX keys and text fields, compiled once at import
+_UUID_RE = re.compile(
+    r"[a-fA-F0-9]{8}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{12}"
+)
+_HEX32_RE = re.compile(r"[a-fA-F0-9]{32}")
+_NON_DIGIT_RE = re.compile(r"[^\d]")
+_CPF_RE = re.compile(r"\d{3}\.\d{3}\.\d{3}-\d{2}")
+_CNPJ_RE = re.compile(r"\d{2}\.?\d{3}\.?\d{3}/?\d{4}-?\d{2}")
+_NON_ALNUM_SPACE_RE = re.compile(r"[^a-zA-Z0-9 ]")
+_NON_ALNUM_RE = re.compile(r"[^a-zA-Z0-9]")
+
+
+def _emv(tag: str, value: str) -> str:
+    """Format a single EMV field: TAG + LENGTH (2 digits) + VALUE."""
+    return f"{tag}{len(value):02d}{value}"
+
+
+# QR mask applied to every PIX code (0-7); payload and error correction are unaffected
+QR_MASK_PATTERN = 0
+QR_BOX_SIZE = 10
+QR_BORDER = 4
+
+
+@functools.lru_cache(maxsize=512)
+def _render_qr_png(pix_code: str) -> bytes:
+    """Render a PIX code as PNG bytes; identical codes reuse the cached image."""
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=qrcode.constants.ERROR_CORRECT_M,
+        box_size=QR_BOX_SIZE,
+        border=QR_BORDER,
+        # Any mask is valid for scanners; pinning one skips the costly best-mask search
+        mask_pattern=QR_MASK_PATTERN,
+    )
+    qr.add_data(pix_code)
+    qr.make(fit=True)
+
+    # One pixel per module (border included), scaled up in C instead of drawing each box
+    matrix = qr.get_matrix()
+    size = len(matrix)
+    pixels = bytes(0 if module else 255 for row in matrix for module in row)
+    img = (
+        Image.frombytes("L", (size, size), pixels)
+        .convert("1", dither=Image.Dither.NONE)
+        .resize((size * QR_BOX_SIZE, size * QR_BOX_SIZE), Image.Resampling.NEAREST)
+    )
+
+    buffer = io.BytesIO()
+    # Low zlib effort: the bilevel image stays small and encodes several times faster
+    img.save(buffer, format="PNG", compress_level=1)
+    return buffer.getvalue()
 
 
 class PixServiceInterface(Protocol):
@@ -34,6 +89,10 @@ class PixServiceInterface(Protocol):
         """Generate a QR code image for PIX payment."""
         ...
 
+    def qr_code_from_payload(self, pix_code: str) -> bytes:
+        """Render a QR code image for an already built PIX code."""
+        ...
+
 
 @dataclass
 class PixPayload:
@@ -79,17 +138,32 @@ class PixService:
         self.merchant_name = self._normalize_text(merchant_name, 25)
         self.merchant_city = self._normalize_text(merchant_city, 15)
 
-    def _remove_accents(self, text: str) -> str:
+        # Fields that never change for this instance, formatted once
+        # 00 - Payload Format Indicator (required, always "01")
+        self._payload_format = _emv(self.PAYLOAD_FORMAT_INDICATOR, "01")
+        # 52 - Merchant Category Code ("0000" for generic) + 53 - Currency ("986" for BRL)
+        self._category_and_currency = _emv(self.MERCHANT_CATEGORY_CODE, "0000") + _emv(
+            self.TRANSACTION_CURRENCY, "986"
+        )
+        # 58 - Country Code + 59 - Merchant Name + 60 - Merchant City (all required)
+        self._country_and_merchant = (
+            _emv(self.COUNTRY_CODE, "BR")
+            + _emv(self.MERCHANT_NAME, self.merchant_name or "PAGAMENTO")
+            + _emv(self.MERCHANT_CITY, self.merchant_city or "BRASIL")
+        )
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _remove_accents(text: str) -> str:
         """Remove accents from text."""
         # Normalize to NFD form (decomposed)
         normalized = unicodedata.normalize("NFD", text)
         # Remove combining characters (accents)
-        without_accents = "".join(
-            char for char in normalized if unicodedata.category(char) != "Mn"
-        )
-        return without_accents
+        return "".join(char for char in normalized if unicodedata.category(char) != "Mn")
 
-    def _normalize_pix_key(self, key: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _normalize_pix_key(key: str) -> str:
         """
         Normalize PIX key according to Brazilian Central Bank specifications.
 
@@ -110,28 +184,27 @@ class PixService:
             return key.lower()
 
         # Random key (EVP/UUID): check UUID pattern first
+        # Regexes below only run when the length can match, which rules out most keys
+        key_length = len(key)
+
         # UUID format: xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx
-        uuid_pattern = r"^[a-fA-F0-9]{8}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{4}-[a-fA-F0-9]{12}$"
-        if re.match(uuid_pattern, key):
+        if key_length == 36 and _UUID_RE.fullmatch(key):
             return key.lower()
 
         # Check for 32 hex characters (UUID without hyphens)
-        hex_only = re.sub(r"[^a-fA-F0-9]", "", key)
-        if len(hex_only) == 32 and re.match(r"^[a-fA-F0-9]+$", key):
-            return f"{hex_only[:8]}-{hex_only[8:12]}-{hex_only[12:16]}-{hex_only[16:20]}-{hex_only[20:]}".lower()
+        if key_length == 32 and _HEX32_RE.fullmatch(key):
+            return f"{key[:8]}-{key[8:12]}-{key[12:16]}-{key[16:20]}-{key[20:]}".lower()
 
         # Remove all non-digit characters for analysis
-        digits_only = re.sub(r"[^\d]", "", key)
+        digits_only = _NON_DIGIT_RE.sub("", key)
         has_plus = key.startswith("+")
 
         # CPF pattern: XXX.XXX.XXX-XX (must have formatting to be detected as CPF)
-        cpf_formatted_pattern = r"^\d{3}\.\d{3}\.\d{3}-\d{2}$"
-        if re.match(cpf_formatted_pattern, key) and len(digits_only) == 11:
+        if key_length == 14 and len(digits_only) == 11 and _CPF_RE.fullmatch(key):
             return digits_only
 
         # CNPJ pattern: XX.XXX.XXX/XXXX-XX
-        cnpj_pattern = r"^\d{2}\.?\d{3}\.?\d{3}/?\d{4}-?\d{2}$"
-        if re.match(cnpj_pattern, key) and len(digits_only) == 14:
+        if 14 <= key_length <= 18 and len(digits_only) == 14 and _CNPJ_RE.fullmatch(key):
             return digits_only
 
         # Phone detection:
@@ -141,7 +214,7 @@ class PixService:
         # 4. Has 10-11 digits and looks like BR phone (DDD + number)
         #    - 11 digits: DDD (2) + 9 + 8 digits (mobile)
         #    - 10 digits: DDD (2) + 8 digits (landline)
-        has_parentheses = bool(re.search(r"[\(\)]", key))
+        has_parentheses = "(" in key or ")" in key
 
         # Check if it looks like a Brazilian phone (DDD 11-99 + number starting with 9 for mobile)
         looks_like_br_phone = False
@@ -189,7 +262,9 @@ class PixService:
         # Default: return as-is
         return key
 
-    def _normalize_text(self, value: str, max_length: int) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _normalize_text(value: str, max_length: int) -> str:
         """
         Normalize text for PIX fields.
         - Remove accents
@@ -201,15 +276,17 @@ class PixService:
             return ""
 
         # Remove accents
-        value = self._remove_accents(value)
+        value = PixService._remove_accents(value)
         # Keep only alphanumeric and spaces
-        value = re.sub(r"[^a-zA-Z0-9 ]", "", value)
+        value = _NON_ALNUM_SPACE_RE.sub("", value)
         # Remove extra spaces
         value = " ".join(value.split())
         # Convert to uppercase and limit length
         return value.upper()[:max_length]
 
-    def _normalize_txid(self, value: str, max_length: int = 25) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _normalize_txid(value: str, max_length: int = 25) -> str:
         """
         Normalize transaction ID for PIX.
         - Keep only alphanumeric characters (no spaces, no special chars)
@@ -220,27 +297,22 @@ class PixService:
             return "***"
 
         # Remove accents first
-        value = self._remove_accents(value)
+        value = PixService._remove_accents(value)
         # Keep only alphanumeric (no spaces)
-        value = re.sub(r"[^a-zA-Z0-9]", "", value)
+        value = _NON_ALNUM_RE.sub("", value)
         # Convert to uppercase and limit length
         result = value.upper()[:max_length]
 
         return result if result else "***"
 
-    def _format_emv_field(self, tag: str, value: str) -> str:
-        """Format a single EMV field: TAG + LENGTH (2 digits) + VALUE."""
-        length = str(len(value)).zfill(2)
-        return f"{tag}{length}{value}"
-
     def _build_merchant_account_info(self, payload: PixPayload) -> str:
         """Build the merchant account information field (tag 26)."""
         # GUI (tag 00) - required
-        gui = self._format_emv_field("00", self.PIX_GUI)
+        gui = _emv("00", self.PIX_GUI)
 
         # PIX Key (tag 01) - required, normalized according to key type
         pix_key = self._normalize_pix_key(payload.pix_key or self.pix_key)
-        key = self._format_emv_field("01", pix_key)
+        key = _emv("01", pix_key)
 
         content = gui + key
 
@@ -248,16 +320,16 @@ class PixService:
         if payload.description:
             description = self._normalize_text(payload.description, 25)
             if description:
-                content += self._format_emv_field("02", description)
+                content += _emv("02", description)
 
-        return self._format_emv_field(self.MERCHANT_ACCOUNT_INFO, content)
+        return _emv(self.MERCHANT_ACCOUNT_INFO, content)
 
     def _build_additional_data_field(self, payload: PixPayload) -> str:
         """Build the additional data field (tag 62)."""
         # Transaction ID (tag 05)
         txid = self._normalize_txid(payload.transaction_id, 25)
-        content = self._format_emv_field("05", txid)
-        return self._format_emv_field(self.ADDITIONAL_DATA_FIELD, content)
+        content = _emv("05", txid)
+        return _emv(self.ADDITIONAL_DATA_FIELD, content)
 
     def _calculate_crc16(self, payload: str) -> str:
         """
@@ -267,21 +339,12 @@ class PixService:
         """
         # Add CRC placeholder (tag 63 + length 04)
         payload_with_crc = payload + self.CRC16 + "04"
-        data = payload_with_crc.encode("utf-8")
-
-        crc = 0xFFFF
-        polynomial = 0x1021
-
-        for byte in data:
-            crc ^= byte << 8
-            for _ in range(8):
-                if crc & 0x8000:
-                    crc = (crc << 1) ^ polynomial
-                else:
-                    crc <<= 1
-                crc &= 0xFFFF
+        # Normalized fields are ASCII; only a raw random/email key can carry other characters
+        encoding = "ascii" if payload_with_crc.isascii() else "utf-8"
+        data = payload_with_crc.encode(encoding)
 
-        return format(crc, "04X")
+        # binascii implements the same CCITT polynomial in C
+        return format(crc_hqx(data, 0xFFFF), "04X")
 
     def generate_pix_code(
         self,
@@ -311,10 +374,8 @@ class PixService:
             transaction_id=transaction_id,
         )
 
-        result = ""
-
-        # 00 - Payload Format Indicator (required, always "01")
-        result += self._format_emv_field(self.PAYLOAD_FORMAT_INDICATOR, "01")
+        # 00 - Payload Format Indicator
+        parts: list[str] = [self._payload_format]
 
         # 01 - Point of Initiation Method (OPTIONAL)
         # "11" = static (reusable), "12" = dynamic (one-time)
@@ -323,38 +384,26 @@ class PixService:
         # to ensure maximum compatibility with all bank apps.
 
         # 26 - Merchant Account Information (PIX specific)
-        result += self._build_merchant_account_info(payload)
-
-        # 52 - Merchant Category Code (required, "0000" for generic)
-        result += self._format_emv_field(self.MERCHANT_CATEGORY_CODE, "0000")
+        parts.append(self._build_merchant_account_info(payload))
 
-        # 53 - Transaction Currency (required, "986" for BRL)
-        result += self._format_emv_field(self.TRANSACTION_CURRENCY, "986")
+        # 52 - Merchant Category Code, 53 - Transaction Currency
+        parts.append(self._category_and_currency)
 
         # 54 - Transaction Amount (optional)
         if amount is not None and amount > 0:
             amount_str = f"{amount:.2f}"
-            result += self._format_emv_field(self.TRANSACTION_AMOUNT, amount_str)
+            parts.append(_emv(self.TRANSACTION_AMOUNT, amount_str))
 
-        # 58 - Country Code (required, "BR")
-        result += self._format_emv_field(self.COUNTRY_CODE, "BR")
-
-        # 59 - Merchant Name (required)
-        merchant_name = payload.merchant_name or self.merchant_name or "PAGAMENTO"
-        result += self._format_emv_field(self.MERCHANT_NAME, merchant_name)
-
-        # 60 - Merchant City (required)
-        merchant_city = payload.merchant_city or self.merchant_city or "BRASIL"
-        result += self._format_emv_field(self.MERCHANT_CITY, merchant_city)
+        # 58 - Country Code, 59 - Merchant Name, 60 - Merchant City
+        parts.append(self._country_and_merchant)
 
         # 62 - Additional Data Field (contains txid)
-        result += self._build_additional_data_field(payload)
+        parts.append(self._build_additional_data_field(payload))
 
         # 63 - CRC16 checksum (required, must be last)
+        result = "".join(parts)
         crc = self._calculate_crc16(result)
-        result += f"{self.CRC16}04{crc}"
-
-        return result
+        return f"{result}{self.CRC16}04{crc}"
 
     def generate_qr_code(
         self,
@@ -382,19 +431,27 @@ class PixService:
             pix_key=pix_key,
         )
 
-        qr = qrcode.QRCode(
-            version=1,
-            error_correction=qrcode.constants.ERROR_CORRECT_M,
-            box_size=10,
-            border=4,
-        )
-        qr.add_data(pix_code)
-        qr.make(fit=True)
+        return self.qr_code_from_payload(pix_code)
+
+    def qr_code_from_payload(self, pix_code: str) -> bytes:
+        """
+        Render a QR code image for an already built PIX code.
+
+        Lets callers that also display the copy-and-paste code skip building it twice.
 
-        img = qr.make_image(fill_color="black", back_color="white")
+        Args:
+            pix_code: PIX code returned by generate_pix_code
 
-        buffer = io.BytesIO()
-        img.save(buffer, format="PNG")
-        buffer.seek(0)
+        Returns:
+            PNG image bytes
+        """
+        return _render_qr_png(pix_code)
 
-        return buffer.getvalue()
+
+@functools.lru_cache(maxsize=256)
+def get_pix_service(pix_key: str, merchant_name: str, merchant_city: str) -> PixService:
+    """Return a shared PixService for the given key and merchant data.
+
+    Resolve it through ``container.core.account_pix_service`` rather than calling this directly.
+    """
+    return PixService(pix_key=pix_key, merchant_name=merchant_name, merchant_city=merchant_city)
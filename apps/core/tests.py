@@ -0,0 +1,82 @@
+"""
+Tests for the core services.
+"""
+
+from decimal import Decimal
+
+from django.test import SimpleTestCase
+
+from apps.core.services import PixService
+
+
+def _crc16_ccitt(data: bytes) -> str:
+    """Bitwise CRC16-CCITT-FALSE, as written in the BR Code spec."""
+    crc = 0xFFFF
+    for byte in data:
+        crc ^= byte << 8
+        for _ in range(8):
+            crc = ((crc << 1) ^ 0x1021) if crc & 0x8000 else crc << 1
+            crc &= 0xFFFF
+    return f"{crc:04X}"
+
+
+class PixCodeParityTests(SimpleTestCase):
+    """Generated BR Codes must stay byte-for-byte identical for the same inputs."""
+
+    CASES = [
+        (
+            ("financeiro@escola.com.br", "Associação de Pais", "São Paulo"),
+            {
+                "amount": Decimal("150.00"),
+                "description": "Festa Junina",
+                "transaction_id": "EVT-2024/06",
+            },
+            "00020126620014br.gov.bcb.pix0124financeiro@escola.com.br0212FESTA JUNINA"
+            "5204000053039865406150.005802BR5918ASSOCIACAO DE PAIS6009SAO PAULO"
+            "62130509EVT2024066304592F",
+        ),
+        (
+            ("+55 (11) 98765-4321", "Maria José", "Belo Horizonte"),
+            {"amount": Decimal("35.5")},
+            "00020126360014br.gov.bcb.pix0114+5511987654321520400005303986540535.50"
+            "5802BR5910MARIA JOSE6014BELO HORIZONTE62070503***630461F6",
+        ),
+        (
+            ("123.456.789-09", "", ""),
+            {},
+            "00020126330014br.gov.bcb.pix0111123456789095204000053039865802BR"
+            "5909PAGAMENTO6006BRASIL62070503***6304B5A6",
+        ),
+        (
+            (
+                "123e4567-e89b-12d3-a456-426614174000",
+                "Escola Municipal Professor João",
+                "Florianópolis",
+            ),
+            {"amount": Decimal("0"), "transaction_id": "abc 123"},
+            "00020126580014br.gov.bcb.pix0136123e4567-e89b-12d3-a456-426614174000"
+            "5204000053039865802BR5925ESCOLA MUNICIPAL PROFESSO6013FLORIANOPOLIS"
+            "62100506ABC1236304646C",
+        ),
+    ]
+
+    def test_payload(self):
+        for args, kwargs, expected in self.CASES:
+            with self.subTest(pix_key=args[0]):
+                self.assertEqual(PixService(*args).generate_pix_code(**kwargs), expected)
+
+    def test_crc(self):
+        for args, kwargs, _ in self.CASES:
+            with self.subTest(pix_key=args[0]):
+                code = PixService(*args).generate_pix_code(**kwargs)
+                body, crc = code[:-4], code[-4:]
+                self.assertTrue(body.endswith("6304"))
+                self.assertEqual(crc, _crc16_ccitt(body.encode()))
+
+    def test_qr_code_is_png(self):
+        service = PixService("financeiro@escola.com.br", "Associação de Pais", "São Paulo")
+        png = service.generate_qr_code(amount=Decimal("10.00"))
+        self.assertTrue(png.startswith(b"\x89PNG\r\n\x1a\n"))
+        self.assertEqual(
+            png, service.qr_code_from_payload(service.generate_pix_code(Decimal("10")))
+        )
@@ -0,0 +1,79 @@
+"""
+Tests for the dashboard views.
+"""
+
+from datetime import date, timedelta
+from decimal import Decimal
+from itertools import count
+
+from django.test import TestCase
+from django.urls import reverse
+
+from apps.accounts.models import Guardian, User
+from apps.classes.models import ClassMember, SchoolClass, Student
+from apps.events.models import Event, Payment
+
+_names = count()
+
+
+def _add_class(guardian: Guardian) -> SchoolClass:
+    """Add a class the guardian belongs to, with a student, an event and a payment."""
+    school_class = SchoolClass.objects.create(name=f"Turma {next(_names)}", school="Escola Teste")
+    ClassMember.objects.create(school_class=school_class, guardian=guardian)
+    Student.objects.create(name="Aluno", school_class=school_class, guardian=guardian)
+    event = Event.objects.create(
+        school_class=school_class,
+        title="Passeio",
+        event_date=date.today() + timedelta(days=7),
+        individual_amount=Decimal("25.00"),
+    )
+    Payment.objects.create(
+        event=event,
+        guardian=guardian,
+        amount=Decimal("25.00"),
+        status=Payment.Status.CONFIRMED,
+    )
+    return school_class
+
+
+class DashboardQueryCountTests(TestCase):
+    """The dashboard runs a fixed number of queries however many classes a guardian has."""
+
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create_user(
+            email="painel@example.com", password="senha-teste", first_name="Teste"
+        )
+        cls.guardian = Guardian.objects.create(user=user)
+        for _ in range(2):
+            _add_class(cls.guardian)
+
+    def setUp(self):
+        self.client.force_login(self.guardian.user)
+
+    def test_dashboard_queries(self):
+        url = reverse("dashboard:index")
+        # session, user + guardian, class ids, classes, students, event stats,
+        # upcoming events, payment stats, chart, recent payments
+        with self.assertNumQueries(10):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+        for _ in range(3):
+            _add_class(self.guardian)
+        with self.assertNumQueries(10):
+            response = self.client.get(url)
+        self.assertEqual(response.context["total_classes"], 5)
+        self.assertEqual(response.context["total_students"], 5)
+        self.assertEqual(response.context["total_events"], 5)
+        self.assertEqual(response.context["total_payments"], Decimal("125.00"))
+
+    def test_dashboard_without_guardian(self):
+        user = User.objects.create_user(
+            email="sem-perfil@example.com", password="senha-teste", first_name="Teste"
+        )
+        self.client.force_login(user)
+        # session, user (the guardian join comes back empty)
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse("dashboard:index"))
+        self.assertFalse(response.context["has_guardian"])
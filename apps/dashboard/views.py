@@ -2,12 +2,11 @@
 Dashboard views for School Hub.
 """
 
-import json
 from datetime import date
 from decimal import Decimal
 
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.db.models import Count, Sum
+from django.db.models import Count, Q, Sum
 from django.db.models.functions import TruncMonth
 from django.views.generic import TemplateView
 
@@ -15,6 +14,24 @@ from apps.classes.models import SchoolClass
 from apps.events.models import Event, Payment
 
 
+def _monthly_series(queryset, date_field: str, aggregate, cast=None) -> tuple[list, list]:
+    """
+    Return chart labels and values for the 12 most recent months, oldest first.
+    The LIMIT runs in SQL; rows are reversed back into chronological order.
+    """
+    rows = list(
+        queryset.annotate(month=TruncMonth(date_field))
+        .values("month")
+        .annotate(value=aggregate)
+        .order_by("-month")[:12]
+    )
+    labels, data = [], []
+    for row in reversed(rows):
+        labels.append(row["month"].strftime("%b/%y"))
+        data.append(cast(row["value"]) if cast else row["value"])
+    return labels, data
+
+
 class DashboardView(LoginRequiredMixin, TemplateView):
     """Main dashboard view for guardians."""
 
@@ -32,61 +49,66 @@ class DashboardView(LoginRequiredMixin, TemplateView):
 
         context["has_guardian"] = True
 
-        # Get user's classes
-        class_ids = guardian.class_memberships.values_list("school_class_id", flat=True)
-        classes = SchoolClass.objects.filter(id__in=class_ids, is_active=True)
+        # Get user's classes (ids materialized once and inlined in the queries below)
+        class_ids = list(guardian.class_memberships.values_list("school_class_id", flat=True))
+
+        # Classes with their stats (use distinct=True to avoid incorrect counts due to JOINs)
+        classes = list(
+            SchoolClass.objects.filter(id__in=class_ids, is_active=True)
+            .annotate(
+                events_total=Count("events", distinct=True),
+                students_total=Count("students", distinct=True),
+            )
+            .order_by("-year", "name")
+        )
+        context["classes"] = classes
 
         # Statistics
-        context["total_classes"] = classes.count()
+        context["total_classes"] = len(classes)
         context["total_students"] = guardian.students.count()
 
         # Events
         all_events = Event.objects.filter(school_class_id__in=class_ids)
-        context["total_events"] = all_events.count()
-        context["active_events"] = all_events.filter(is_active=True).count()
+        event_stats = all_events.aggregate(
+            total=Count("id"),
+            active=Count("id", filter=Q(is_active=True)),
+        )
+        context["total_events"] = event_stats["total"]
+        context["active_events"] = event_stats["active"]
 
         # Upcoming events
-        context["upcoming_events"] = all_events.filter(
-            is_active=True,
-            event_date__gte=date.today(),
-        ).order_by("event_date")[:5]
+        context["upcoming_events"] = (
+            all_events.filter(is_active=True, event_date__gte=date.today())
+            .select_related("school_class")
+            .order_by("event_date")[:5]
+        )
 
         # My payments
         my_payments = Payment.objects.filter(guardian=guardian)
-        context["total_payments"] = my_payments.aggregate(
-            total=Sum("amount")
-        )["total"] or Decimal("0.00")
-        context["pending_payments_count"] = my_payments.filter(
-            status=Payment.Status.PENDING
-        ).count()
+        payment_stats = my_payments.aggregate(
+            total=Sum("amount"),
+            pending=Count("id", filter=Q(status=Payment.Status.PENDING)),
+        )
+        context["total_payments"] = payment_stats["total"] or Decimal("0.00")
+        context["pending_payments_count"] = payment_stats["pending"]
 
         # Monthly expenses chart data
-        monthly_data = list(
-            my_payments.filter(status=Payment.Status.CONFIRMED)
-            .annotate(month=TruncMonth("created_at"))
-            .values("month")
-            .annotate(total=Sum("amount"))
-            .order_by("month")
-        )[:12]
-
-        chart_labels = [item["month"].strftime("%b/%y") for item in monthly_data]
-        chart_data = [float(item["total"]) for item in monthly_data]
+        chart_labels, chart_data = _monthly_series(
+            my_payments.filter(status=Payment.Status.CONFIRMED),
+            "created_at",
+            Sum("amount"),
+            cast=float,
+        )
 
-        # Convert to JSON strings for safe JavaScript rendering
-        context["chart_labels"] = json.dumps(chart_labels)
-        context["chart_data"] = json.dumps(chart_data)
+        # Serialized in the template with json_script
+        context["chart_labels"] = chart_labels
+        context["chart_data"] = chart_data
 
         # Recent payments
         context["recent_payments"] = my_payments.select_related(
             "event__school_class"
         ).order_by("-created_at")[:5]
 
-        # Classes with their stats (use distinct=True to avoid incorrect counts due to JOINs)
-        context["classes"] = classes.annotate(
-            events_total=Count("events", distinct=True),
-            students_total=Count("students", distinct=True),
-        )
-
         return context
 
 
@@ -95,51 +117,38 @@ def dashboard_callback(request, context):
     Callback for Unfold admin dashboard.
     Adds custom statistics and charts to the admin dashboard.
     """
-    from django.db.models import Sum
-    from django.db.models.functions import TruncMonth
-
     # Total statistics
     total_classes = SchoolClass.objects.filter(is_active=True).count()
-    total_events = Event.objects.count()
-    active_events = Event.objects.filter(is_active=True).count()
+    event_stats = Event.objects.aggregate(
+        total=Count("id"),
+        active=Count("id", filter=Q(is_active=True)),
+    )
     total_payments = Payment.objects.filter(
         status=Payment.Status.CONFIRMED
     ).aggregate(total=Sum("amount"))["total"] or Decimal("0.00")
 
     # Monthly events chart
-    monthly_events = (
-        Event.objects.annotate(month=TruncMonth("event_date"))
-        .values("month")
-        .annotate(count=Count("id"))
-        .order_by("month")
-    )[:12]
+    event_labels, event_data = _monthly_series(Event.objects.all(), "event_date", Count("id"))
 
     # Monthly payments chart
-    monthly_payments = (
-        Payment.objects.filter(status=Payment.Status.CONFIRMED)
-        .annotate(month=TruncMonth("created_at"))
-        .values("month")
-        .annotate(total=Sum("amount"))
-        .order_by("month")
-    )[:12]
+    payment_labels, payment_data = _monthly_series(
+        Payment.objects.filter(status=Payment.Status.CONFIRMED),
+        "created_at",
+        Sum("amount"),
+        cast=float,
+    )
 
     context.update(
         {
             "stats": {
                 "total_classes": total_classes,
-                "total_events": total_events,
-                "active_events": active_events,
+                "total_events": event_stats["total"],
+                "active_events": event_stats["active"],
                 "total_payments": f"R$ {total_payments:,.2f}",
             },
             "charts": {
-                "events": {
-                    "labels": [item["month"].strftime("%b/%y") for item in monthly_events],
-                    "data": [item["count"] for item in monthly_events],
-                },
-                "payments": {
-                    "labels": [item["month"].strftime("%b/%y") for item in monthly_payments],
-                    "data": [float(item["total"]) for item in monthly_payments],
-                },
+                "events": {"labels": event_labels, "data": event_data},
+                "payments": {"labels": payment_labels, "data": payment_data},
             },
         }
     )
@@ -3,6 +3,7 @@ Admin configuration for events app.
 """
 
 from django.contrib import admin
+from django.utils import timezone
 from django.utils.html import format_html
 from unfold.admin import ModelAdmin, TabularInline
 
@@ -49,11 +50,15 @@ class EventAdmin(ModelAdmin):
         "is_active",
     ]
     list_filter = ["event_type", "is_active", "school_class", "event_date"]
+    list_select_related = ["school_class"]
     search_fields = ["title", "description", "school_class__name"]
     autocomplete_fields = ["school_class", "created_by", "responsible"]
     date_hierarchy = "event_date"
     inlines = [EventItemInline, PaymentInline, ParticipationInline]
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).with_collected_total()
+
     fieldsets = (
         (
             "Informações do Evento",
@@ -104,6 +109,7 @@ class EventItemAdmin(ModelAdmin):
 
     list_display = ["name", "event", "item_type", "quantity", "unit_price", "assigned_to", "is_completed"]
     list_filter = ["item_type", "is_completed", "event"]
+    list_select_related = ["event__school_class", "assigned_to__user"]
     search_fields = ["name", "event__title"]
     autocomplete_fields = ["event", "assigned_to"]
 
@@ -129,6 +135,7 @@ class PaymentAdmin(ModelAdmin):
 
     list_display = ["guardian", "event", "amount_display", "status", "receipt_link"]
     list_filter = ["status", "event", "event__school_class"]
+    list_select_related = ["guardian__user", "event__school_class"]
     search_fields = ["guardian__user__first_name", "guardian__user__last_name", "event__title"]
     autocomplete_fields = ["event", "guardian"]
     readonly_fields = ["confirmed_by", "confirmed_at"]
@@ -158,14 +165,23 @@ class PaymentAdmin(ModelAdmin):
     @admin.action(description="Confirmar pagamentos selecionados")
     def confirm_payments(self, request, queryset):
         guardian = getattr(request.user, "guardian", None)
-        for payment in queryset.filter(status=Payment.Status.PENDING):
-            payment.confirm(guardian)
-        self.message_user(request, f"{queryset.count()} pagamento(s) confirmado(s).")
+        now = timezone.now()
+        # Single UPDATE; Payment.confirm has no side effects beyond these fields
+        updated = queryset.filter(status=Payment.Status.PENDING).update(
+            status=Payment.Status.CONFIRMED,
+            confirmed_by=guardian,
+            confirmed_at=now,
+            updated_at=now,
+        )
+        self.message_user(request, f"{updated} pagamento(s) confirmado(s).")
 
     @admin.action(description="Rejeitar pagamentos selecionados")
     def reject_payments(self, request, queryset):
-        queryset.filter(status=Payment.Status.PENDING).update(status=Payment.Status.REJECTED)
-        self.message_user(request, f"{queryset.count()} pagamento(s) rejeitado(s).")
+        updated = queryset.filter(status=Payment.Status.PENDING).update(
+            status=Payment.Status.REJECTED,
+            updated_at=timezone.now(),
+        )
+        self.message_user(request, f"{updated} pagamento(s) rejeitado(s).")
 
 
 @admin.register(EventParticipation)
@@ -174,6 +190,7 @@ class EventParticipationAdmin(ModelAdmin):
 
     list_display = ["guardian", "event", "status", "contribution_display", "guests_count", "confirmed_at"]
     list_filter = ["status", "event", "event__school_class"]
+    list_select_related = ["guardian__user", "event__school_class"]
     search_fields = ["guardian__user__first_name", "guardian__user__last_name", "event__title", "contribution"]
     autocomplete_fields = ["event", "guardian"]
     readonly_fields = ["confirmed_at"]
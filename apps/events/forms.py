@@ -2,25 +2,62 @@
 Forms for events app.
 """
 
+from datetime import date
+
 from django import forms
 
+from apps.core.form_widgets import (
+    date_picker_input,
+    file_input,
+    number_input,
+    select,
+    text_input,
+    textarea,
+    url_input,
+)
+
 from .models import Event, EventItem, EventParticipation, Payment
 
+# Leading bytes of each accepted receipt format
+RECEIPT_SIGNATURES = (
+    (b"\xff\xd8\xff", "jpg"),
+    (b"\x89PNG\r\n\x1a\n", "png"),
+    (b"GIF87a", "gif"),
+    (b"GIF89a", "gif"),
+    (b"%PDF-", "pdf"),
+)
+RECEIPT_HEADER_SIZE = 512
+
+
+def sniff_receipt_type(header: bytes) -> str | None:
+    """Return the receipt format detected from the file's first bytes, if accepted."""
+    for signature, kind in RECEIPT_SIGNATURES:
+        if header.startswith(signature):
+            return kind
+    if header[:4] == b"RIFF" and header[8:12] == b"WEBP":
+        return "webp"
+    return None
+
+
+class DatePickerField(forms.DateField):
+    """Date field that parses the picker's ISO value directly, before trying input_formats."""
+
+    def to_python(self, value):
+        if isinstance(value, str) and len(value) == 10 and value[4] == "-":
+            try:
+                return date.fromisoformat(value)
+            except ValueError:
+                pass
+        return super().to_python(value)
+
 
 class EventForm(forms.ModelForm):
     """Form for creating and updating events."""
 
-    event_date = forms.DateField(
+    event_date = DatePickerField(
         label="Data do Evento",
         input_formats=["%Y-%m-%d", "%d/%m/%Y"],
-        widget=forms.DateInput(
-            format="%Y-%m-%d",
-            attrs={
-                "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent flatpickr-date",
-                "type": "text",
-                "placeholder": "Selecione a data",
-            }
-        ),
+        widget=date_picker_input("Selecione a data"),
     )
 
     class Meta:
@@ -38,62 +75,15 @@ class EventForm(forms.ModelForm):
             "pix_holder_name",
         ]
         widgets = {
-            "title": forms.TextInput(
-                attrs={
-                    "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                    "placeholder": "Ex: Dia das Mães, Festa Junina",
-                }
-            ),
-            "description": forms.Textarea(
-                attrs={
-                    "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                    "rows": 3,
-                    "placeholder": "Descreva o evento, objetivo e informações importantes",
-                }
-            ),
-            "event_type": forms.Select(
-                attrs={
-                    "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                }
-            ),
-            "location": forms.TextInput(
-                attrs={
-                    "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                    "placeholder": "Ex: Escola Municipal João da Silva",
-                }
-            ),
-            "location_url": forms.URLInput(
-                attrs={
-                    "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                    "placeholder": "https://maps.google.com/...",
-                }
-            ),
-            "budget": forms.NumberInput(
-                attrs={
-                    "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                    "placeholder": "0.00",
-                    "step": "0.01",
-                }
-            ),
-            "individual_amount": forms.NumberInput(
-                attrs={
-                    "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                    "placeholder": "Calculado automaticamente",
-                    "step": "0.01",
-                }
-            ),
-            "pix_key": forms.TextInput(
-                attrs={
-                    "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                    "placeholder": "CPF, e-mail, telefone ou chave aleatória",
-                }
-            ),
-            "pix_holder_name": forms.TextInput(
-                attrs={
-                    "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                    "placeholder": "Nome do titular da conta",
-                }
-            ),
+            "title": text_input("Ex: Dia das Mães, Festa Junina"),
+            "description": textarea("Descreva o evento, objetivo e informações importantes"),
+            "event_type": select(),
+            "location": text_input("Ex: Escola Municipal João da Silva"),
+            "location_url": url_input("https://maps.google.com/..."),
+            "budget": number_input("0.00", step="0.01"),
+            "individual_amount": number_input("Calculado automaticamente", step="0.01"),
+            "pix_key": text_input("CPF, e-mail, telefone ou chave aleatória"),
+            "pix_holder_name": text_input("Nome do titular da conta"),
         }
 
 
@@ -104,90 +94,66 @@ class EventItemForm(forms.ModelForm):
         model = EventItem
         fields = ["name", "description", "item_type", "quantity", "unit_price"]
         widgets = {
-            "name": forms.TextInput(
-                attrs={
-                    "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                    "placeholder": "Ex: Bolo, Decoração, Lembrancinhas",
-                }
-            ),
-            "description": forms.Textarea(
-                attrs={
-                    "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                    "rows": 2,
-                    "placeholder": "Descrição do item (opcional)",
-                }
-            ),
-            "item_type": forms.Select(
-                attrs={
-                    "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                }
-            ),
-            "quantity": forms.NumberInput(
-                attrs={
-                    "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                    "min": "1",
-                }
-            ),
-            "unit_price": forms.NumberInput(
-                attrs={
-                    "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                    "placeholder": "0.00",
-                    "step": "0.01",
-                }
-            ),
+            "name": text_input("Ex: Bolo, Decoração, Lembrancinhas"),
+            "description": textarea("Descrição do item (opcional)", rows=2),
+            "item_type": select(),
+            "quantity": number_input(min="1"),
+            "unit_price": number_input("0.00", step="0.01"),
         }
 
 
 class PaymentForm(forms.ModelForm):
     """Form for creating payments."""
 
-    ALLOWED_EXTENSIONS = ["jpg", "jpeg", "png", "gif", "webp", "pdf"]
+    ALLOWED_EXTENSIONS = frozenset({"jpg", "jpeg", "png", "gif", "webp", "pdf"})
+    ALLOWED_EXTENSIONS_LABEL = "jpg, jpeg, png, gif, webp, pdf"
     MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
 
     class Meta:
         model = Payment
         fields = ["amount", "receipt", "notes"]
         widgets = {
-            "amount": forms.NumberInput(
-                attrs={
-                    "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                    "placeholder": "0.00",
-                    "step": "0.01",
-                }
-            ),
-            "receipt": forms.FileInput(
-                attrs={
-                    "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                    "accept": "image/*,.pdf,application/pdf",
-                }
-            ),
-            "notes": forms.Textarea(
-                attrs={
-                    "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                    "rows": 2,
-                    "placeholder": "Observações (opcional)",
-                }
-            ),
+            "amount": number_input("0.00", step="0.01"),
+            "receipt": file_input(accept="image/*,.pdf,application/pdf"),
+            "notes": textarea("Observações (opcional)", rows=2),
         }
 
     def clean_receipt(self):
         """Validate that the receipt is an image or PDF and not too large."""
         receipt = self.cleaned_data.get("receipt")
         if receipt:
+            # Check file size first; it is a plain attribute and rejects the costly uploads
+            if receipt.size > self.MAX_FILE_SIZE:
+                raise forms.ValidationError("O arquivo é muito grande. Tamanho máximo: 10MB")
             # Check file extension
-            ext = receipt.name.split(".")[-1].lower()
+            _, dot, ext = receipt.name.rpartition(".")
+            ext = ext.lower() if dot else ""
             if ext not in self.ALLOWED_EXTENSIONS:
                 raise forms.ValidationError(
-                    f"Formato não permitido. Use: {', '.join(self.ALLOWED_EXTENSIONS)}"
+                    f"Formato não permitido. Use: {self.ALLOWED_EXTENSIONS_LABEL}"
                 )
-            # Check file size
-            if receipt.size > self.MAX_FILE_SIZE:
+            # The content decides: only the first chunk is read, never the whole file
+            header = next(receipt.chunks(chunk_size=RECEIPT_HEADER_SIZE), b"")
+            receipt.seek(0)
+            if sniff_receipt_type(header) is None:
                 raise forms.ValidationError(
-                    "O arquivo é muito grande. Tamanho máximo: 10MB"
+                    "O conteúdo do arquivo não corresponde a uma imagem ou PDF válido."
                 )
         return receipt
 
 
+def _require(*names):
+    """Set which fields are required once on the form class, not on every instance."""
+
+    def decorate(form_class):
+        for name, field in form_class.base_fields.items():
+            field.required = name in names
+        return form_class
+
+    return decorate
+
+
+@_require()
 class ParticipationForm(forms.ModelForm):
     """Form for confirming participation in an event (potluck or presence)."""
 
@@ -195,52 +161,55 @@ class ParticipationForm(forms.ModelForm):
         model = EventParticipation
         fields = ["contribution", "guests_count", "notes"]
         widgets = {
-            "contribution": forms.TextInput(
-                attrs={
-                    "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                    "placeholder": "Ex: Pão de queijo, biscoitos, suco de uva",
-                }
-            ),
-            "guests_count": forms.NumberInput(
-                attrs={
-                    "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                    "min": "1",
-                    "max": "20",
-                }
-            ),
-            "notes": forms.Textarea(
-                attrs={
-                    "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                    "rows": 2,
-                    "placeholder": "Observações, restrições alimentares, etc.",
-                }
-            ),
+            "contribution": text_input("Ex: Pão de queijo, biscoitos, suco de uva"),
+            "guests_count": number_input(min="1", max="20"),
+            "notes": textarea("Observações, restrições alimentares, etc.", rows=2),
+        }
+
+
+@_require("contribution")
+class PotluckParticipationForm(ParticipationForm):
+    """Participation form for potluck and mixed events: asks what the guardian will bring."""
+
+    class Meta(ParticipationForm.Meta):
+        labels = {"contribution": "O que você vai levar? *"}
+        widgets = {**ParticipationForm.Meta.widgets, "guests_count": forms.HiddenInput()}
+
+
+@_require()
+class PresenceParticipationForm(ParticipationForm):
+    """Participation form for presence events: asks how many people will attend."""
+
+    class Meta(ParticipationForm.Meta):
+        labels = {"guests_count": "Quantas pessoas irão?"}
+        widgets = {**ParticipationForm.Meta.widgets, "contribution": forms.HiddenInput()}
+
+
+@_require()
+class PaymentParticipationForm(ParticipationForm):
+    """Participation form for payment events, which collect neither field."""
+
+    class Meta(ParticipationForm.Meta):
+        widgets = {
+            **ParticipationForm.Meta.widgets,
+            "contribution": forms.HiddenInput(),
+            "guests_count": forms.HiddenInput(),
         }
 
-    def __init__(self, *args, event=None, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.event = event
 
-        # Set default values
-        self.fields["guests_count"].required = False
-        self.fields["contribution"].required = False
+PARTICIPATION_FORMS = {
+    Event.EventType.PAYMENT: PaymentParticipationForm,
+    Event.EventType.POTLUCK: PotluckParticipationForm,
+    Event.EventType.PRESENCE: PresenceParticipationForm,
+    Event.EventType.MIXED: PotluckParticipationForm,
+}
 
-        # Adjust fields based on event type
-        if event:
-            if event.is_potluck_event:
-                self.fields["contribution"].required = True
-                self.fields["contribution"].label = "O que você vai levar? *"
-            else:
-                # For non-potluck events, hide contribution field
-                self.fields["contribution"].widget = forms.HiddenInput()
 
-            if event.is_presence_event:
-                self.fields["guests_count"].label = "Quantas pessoas irão?"
-                self.fields["guests_count"].required = False
-            else:
-                # For non-presence events, hide guests_count field
-                self.fields["guests_count"].widget = forms.HiddenInput()
-                self.fields["guests_count"].initial = 1
+def participation_form_for(event: Event | None) -> type[ParticipationForm]:
+    """Return the participation form class shaped for the event's type."""
+    if event is None:
+        return ParticipationForm
+    return PARTICIPATION_FORMS.get(event.event_type, ParticipationForm)
 
 
 class DeclineParticipationForm(forms.Form):
@@ -249,11 +218,5 @@ class DeclineParticipationForm(forms.Form):
     notes = forms.CharField(
         label="Motivo (opcional)",
         required=False,
-        widget=forms.Textarea(
-            attrs={
-                "class": "w-full px-4 py-3 rounded-lg border border-gray-300 focus:ring-2 focus:ring-purple-500 focus:border-transparent",
-                "rows": 2,
-                "placeholder": "Motivo da recusa (opcional)",
-            }
-        ),
+        widget=textarea("Motivo da recusa (opcional)", rows=2),
     )
@@ -0,0 +1,22 @@
+# Generated by Django 5.1.15 on 2026-10-14 04:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_uuid7_primary_keys'),
+        ('events', '0005_uuid7_primary_keys'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='eventparticipation',
+            index=models.Index(fields=['event', 'status', 'guardian'], name='participation_event_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['event', 'status', 'guardian'], name='payment_event_status_idx'),
+        ),
+    ]
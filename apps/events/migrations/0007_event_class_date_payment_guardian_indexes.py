@@ -0,0 +1,23 @@
+# Generated by Django 5.1.15 on 2026-10-14 04:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_uuid7_primary_keys'),
+        ('classes', '0006_classmember_no_default_ordering'),
+        ('events', '0006_event_status_guardian_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['school_class', 'event_date'], name='event_class_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='payment',
+            index=models.Index(fields=['event', 'guardian'], name='payment_event_guardian_idx'),
+        ),
+    ]
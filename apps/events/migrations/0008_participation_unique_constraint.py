@@ -0,0 +1,30 @@
+# Generated by Django 5.1.15 on 2026-10-14 04:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_uuid7_primary_keys'),
+        ('events', '0007_event_class_date_payment_guardian_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='eventparticipation',
+            name='participation_event_status_idx',
+        ),
+        migrations.AlterUniqueTogether(
+            name='eventparticipation',
+            unique_together=set(),
+        ),
+        migrations.AddIndex(
+            model_name='eventparticipation',
+            index=models.Index(condition=models.Q(('status', 'confirmed')), fields=['event', 'guardian'], name='confirmed_participation_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='eventparticipation',
+            constraint=models.UniqueConstraint(fields=('event', 'guardian'), name='uniq_event_participation'),
+        ),
+    ]
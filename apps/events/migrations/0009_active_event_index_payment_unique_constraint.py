@@ -0,0 +1,27 @@
+# Generated by Django 5.1.15 on 2026-10-14 04:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_uuid7_primary_keys'),
+        ('classes', '0006_classmember_no_default_ordering'),
+        ('events', '0008_participation_unique_constraint'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='payment',
+            name='payment_event_guardian_idx',
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['school_class', 'event_date'], name='active_event_class_date_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='payment',
+            constraint=models.UniqueConstraint(fields=('event', 'guardian'), name='payment_event_guardian_uniq'),
+        ),
+    ]
@@ -3,8 +3,11 @@ Models for school events, items, and payments.
 """
 
 from decimal import Decimal
+from functools import cached_property, lru_cache
 
 from django.db import models
+from django.db.models import Exists, OuterRef
+from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 from apps.accounts.models import Guardian
@@ -12,6 +15,33 @@ from apps.classes.models import SchoolClass, Student
 from apps.core.models import BaseModel
 
 
+@lru_cache(maxsize=1024)
+def per_person_amount(budget: Decimal, people: int) -> Decimal:
+    """Split a budget evenly between people, rounded to cents."""
+    return (budget / people).quantize(Decimal("0.01"))
+
+
+class EventQuerySet(models.QuerySet):
+    """QuerySet with payment figures computed in the database."""
+
+    def close(self) -> int:
+        """Close every event in the queryset with a single UPDATE."""
+        now = timezone.now()
+        return self.update(is_active=False, closed_at=now, updated_at=now)
+
+    def with_collected_total(self):
+        """Annotate each event with the sum of its confirmed payments."""
+        return self.annotate(
+            collected_total=Coalesce(
+                models.Sum(
+                    "payments__amount", filter=models.Q(payments__status=Payment.Status.CONFIRMED)
+                ),
+                Decimal("0.00"),
+                output_field=models.DecimalField(max_digits=12, decimal_places=2),
+            )
+        )
+
+
 class Event(BaseModel):
     """
     Represents a school event.
@@ -24,6 +54,10 @@ class Event(BaseModel):
         PRESENCE = "presence", "Confirmação de Presença"
         MIXED = "mixed", "Misto"
 
+    PAYMENT_TYPES = frozenset({EventType.PAYMENT, EventType.MIXED})
+    POTLUCK_TYPES = frozenset({EventType.POTLUCK, EventType.MIXED})
+    PARTICIPATION_TYPES = frozenset({EventType.POTLUCK, EventType.PRESENCE, EventType.MIXED})
+
     school_class = models.ForeignKey(
         SchoolClass,
         on_delete=models.CASCADE,
@@ -110,105 +144,150 @@ class Event(BaseModel):
         blank=True,
     )
 
+    objects = EventQuerySet.as_manager()
+
     class Meta:
         verbose_name = "Evento"
         verbose_name_plural = "Eventos"
         ordering = ["-event_date", "-created_at"]
+        indexes = [
+            # Class event lists are filtered by class and sorted by date
+            models.Index(fields=["school_class", "event_date"], name="event_class_date_idx"),
+            # Same, for the pages that only list open events; closed events stay out of it
+            models.Index(
+                fields=["school_class", "event_date"],
+                condition=models.Q(is_active=True),
+                name="active_event_class_date_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"{self.title} - {self.school_class.name}"
 
-    @property
+    # Type flags are read many times per render; event_type does not change mid-request
+    @cached_property
     def is_payment_event(self) -> bool:
         """Check if this event requires payments."""
-        return self.event_type in [self.EventType.PAYMENT, self.EventType.MIXED]
+        return self.event_type in self.PAYMENT_TYPES
 
-    @property
+    @cached_property
     def is_potluck_event(self) -> bool:
         """Check if this event is a potluck."""
-        return self.event_type in [self.EventType.POTLUCK, self.EventType.MIXED]
+        return self.event_type in self.POTLUCK_TYPES
 
-    @property
+    @cached_property
     def is_presence_event(self) -> bool:
         """Check if this event requires presence confirmation."""
         return self.event_type == self.EventType.PRESENCE
 
-    @property
+    @cached_property
     def requires_participation(self) -> bool:
         """Check if this event requires participation confirmation (potluck or presence)."""
-        return self.event_type in [
-            self.EventType.POTLUCK,
-            self.EventType.PRESENCE,
-            self.EventType.MIXED,
-        ]
+        return self.event_type in self.PARTICIPATION_TYPES
+
+    @cached_property
+    def pix_txid(self) -> str:
+        """PIX transaction id: the UUID hex (without hyphens), cut to the 25-char limit."""
+        return self.id.hex[:25]
+
+    @cached_property
+    def pix_description(self) -> str:
+        """Event title cut to the PIX description limit."""
+        return self.title[:25]
 
     @property
     def confirmed_participations(self):
         """Get confirmed participations for this event."""
         return self.participations.filter(status=EventParticipation.Status.CONFIRMED)
 
-    @property
+    @cached_property
     def pending_participations_students(self):
         """Get students who haven't confirmed participation."""
-        confirmed_guardian_ids = self.participations.filter(
-            status=EventParticipation.Status.CONFIRMED
-        ).values_list("guardian_id", flat=True)
-
-        return Student.objects.filter(school_class=self.school_class).exclude(
-            guardian_id__in=confirmed_guardian_ids
+        # NOT EXISTS lets the planner anti-join instead of scanning a NOT IN list
+        has_confirmed = Exists(
+            EventParticipation.objects.filter(
+                event=self,
+                status=EventParticipation.Status.CONFIRMED,
+                guardian_id=OuterRef("guardian_id"),
+            )
         )
+        return Student.objects.filter(~has_confirmed, school_class_id=self.school_class_id)
+
+    @cached_property
+    def _payment_stats(self) -> dict:
+        """Collected, pending and progress figures, computed with at most one query."""
+        collected = getattr(self, "collected_total", None)
+        if collected is None:
+            collected = self.payments.filter(status=Payment.Status.CONFIRMED).aggregate(
+                total=models.Sum("amount")
+            )["total"] or Decimal("0.00")
+
+        pending = Decimal("0.00")
+        percentage = 0
+        if self.budget:
+            pending = self.budget - collected
+            if self.budget > 0:
+                percentage = min(100, int((collected / self.budget) * 100))
+        return {"collected": collected, "pending": pending, "percentage": percentage}
 
     @property
     def total_collected(self) -> Decimal:
         """Calculate total amount collected."""
-        return self.payments.filter(status=Payment.Status.CONFIRMED).aggregate(
-            total=models.Sum("amount")
-        )["total"] or Decimal("0.00")
+        return self._payment_stats["collected"]
 
     @property
     def total_pending(self) -> Decimal:
         """Calculate total amount pending."""
-        if self.budget:
-            return self.budget - self.total_collected
-        return Decimal("0.00")
+        return self._payment_stats["pending"]
 
     @property
     def payment_progress_percentage(self) -> int:
         """Calculate payment progress as percentage."""
-        if self.budget and self.budget > 0:
-            return min(100, int((self.total_collected / self.budget) * 100))
-        return 0
+        return self._payment_stats["percentage"]
 
-    @property
+    @cached_property
     def paid_students(self):
         """Get list of students who have paid."""
-        return Student.objects.filter(
-            guardian__payments__event=self,
-            guardian__payments__status=Payment.Status.CONFIRMED,
-        ).distinct()
+        # EXISTS avoids joining every payment row and deduplicating with DISTINCT
+        has_paid = Exists(
+            Payment.objects.filter(
+                event=self,
+                status=Payment.Status.CONFIRMED,
+                guardian_id=OuterRef("guardian_id"),
+            )
+        )
+        return Student.objects.filter(has_paid)
 
-    @property
+    @cached_property
     def pending_students(self):
         """Get list of students who haven't paid."""
-        paid_guardian_ids = self.payments.filter(status=Payment.Status.CONFIRMED).values_list(
-            "guardian_id", flat=True
-        )
-
-        return Student.objects.filter(school_class=self.school_class).exclude(
-            guardian_id__in=paid_guardian_ids
+        has_paid = Exists(
+            Payment.objects.filter(
+                event=self,
+                status=Payment.Status.CONFIRMED,
+                guardian_id=OuterRef("guardian_id"),
+            )
         )
+        return Student.objects.filter(~has_paid, school_class_id=self.school_class_id)
 
     def calculate_individual_amount(self) -> Decimal | None:
         """Calculate amount per person based on budget and student count."""
-        if self.budget and self.school_class.student_count > 0:
-            return (self.budget / self.school_class.student_count).quantize(Decimal("0.01"))
+        if not self.budget:
+            return None
+        # Read once: student_count runs a COUNT query unless the class was annotated
+        student_count = self.school_class.student_count
+        if student_count > 0:
+            return per_person_amount(self.budget, student_count)
         return None
 
     def close(self):
         """Close the event."""
+        # Single UPDATE, keeping self in sync
+        now = timezone.now()
         self.is_active = False
-        self.closed_at = timezone.now()
-        self.save(update_fields=["is_active", "closed_at", "updated_at"])
+        self.closed_at = now
+        self.updated_at = now
+        Event.objects.filter(pk=self.pk).update(is_active=False, closed_at=now, updated_at=now)
 
 
 class EventItem(BaseModel):
@@ -281,6 +360,21 @@ class EventItem(BaseModel):
         return None
 
 
+class PaymentManager(models.Manager):
+    """Manager with batched payment helpers."""
+
+    def bulk_add(self, event: Event, guardians, amount: Decimal, batch_size: int = 500, **fields):
+        """
+        Create one payment per guardian in multi-row INSERTs.
+        Guardians that already have a payment for the event are skipped.
+        """
+        return self.bulk_create(
+            [self.model(event=event, guardian=g, amount=amount, **fields) for g in guardians],
+            ignore_conflicts=True,
+            batch_size=batch_size,
+        )
+
+
 class Payment(BaseModel):
     """
     Represents a payment made by a guardian for an event.
@@ -291,6 +385,9 @@ class Payment(BaseModel):
         CONFIRMED = "confirmed", "Confirmado"
         REJECTED = "rejected", "Rejeitado"
 
+    # Plain value for is_confirmed; reading an enum member is comparatively slow
+    _CONFIRMED = Status.CONFIRMED.value
+
     event = models.ForeignKey(
         Event,
         on_delete=models.CASCADE,
@@ -338,30 +435,95 @@ class Payment(BaseModel):
         blank=True,
     )
 
+    objects = PaymentManager()
+
     class Meta:
         verbose_name = "Pagamento"
         verbose_name_plural = "Pagamentos"
         ordering = ["-created_at"]
+        indexes = [
+            # Per-event status lookups, e.g. the paid/pending student lists
+            models.Index(fields=["event", "status", "guardian"], name="payment_event_status_idx"),
+        ]
+        constraints = [
+            # One payment per guardian per event; also indexes a guardian's own payment lookup
+            models.UniqueConstraint(
+                fields=["event", "guardian"], name="payment_event_guardian_uniq"
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"{self.guardian} - {self.event.title} - R$ {self.amount}"
 
     def confirm(self, confirmed_by: Guardian):
         """Confirm the payment."""
+        now = timezone.now()
         self.status = self.Status.CONFIRMED
         self.confirmed_by = confirmed_by
-        self.confirmed_at = timezone.now()
-        self.save(update_fields=["status", "confirmed_by", "confirmed_at", "updated_at"])
+        self.confirmed_at = now
+        self.updated_at = now
+        Payment.objects.filter(pk=self.pk).update(
+            status=self.status,
+            confirmed_by=confirmed_by,
+            confirmed_at=now,
+            updated_at=now,
+        )
 
     def reject(self):
         """Reject the payment."""
         self.status = self.Status.REJECTED
-        self.save(update_fields=["status", "updated_at"])
+        self.updated_at = timezone.now()
+        Payment.objects.filter(pk=self.pk).update(status=self.status, updated_at=self.updated_at)
 
     @property
     def is_confirmed(self) -> bool:
         """Check if payment is confirmed."""
-        return self.status == self.Status.CONFIRMED
+        return self.status == self._CONFIRMED
+
+
+class EventParticipationManager(models.Manager):
+    """Manager with single-statement participation state transitions."""
+
+    def _upsert(self, event: Event, guardian: Guardian, **values) -> None:
+        # INSERT ... ON CONFLICT (event, guardian) DO UPDATE, leaning on the unique constraint.
+        # Nothing is returned: on conflict the stored row keeps its own pk, not the one built here
+        self.bulk_create(
+            [self.model(event=event, guardian=guardian, **values)],
+            update_conflicts=True,
+            unique_fields=["event", "guardian"],
+            update_fields=[*values, "updated_at"],
+        )
+
+    def confirm(
+        self,
+        event: Event,
+        guardian: Guardian,
+        contribution: str = "",
+        guests_count: int = 1,
+        notes: str = "",
+    ) -> None:
+        """Confirm a guardian's participation, creating the row if needed."""
+        self._upsert(
+            event,
+            guardian,
+            status=self.model.Status.CONFIRMED,
+            contribution=contribution,
+            guests_count=guests_count,
+            notes=notes,
+            confirmed_at=timezone.now(),
+        )
+
+    def decline(self, event: Event, guardian: Guardian, notes: str = "") -> None:
+        """Decline a guardian's participation, creating the row if needed."""
+        self._upsert(event, guardian, status=self.model.Status.DECLINED, notes=notes)
+
+    def cancel(self, event: Event, guardian: Guardian, notes: str = "") -> bool:
+        """Decline a confirmed participation; return False if none was confirmed."""
+        return bool(
+            self.filter(event=event, guardian=guardian, status=self.model.Status.CONFIRMED).update(
+                status=self.model.Status.DECLINED, notes=notes, updated_at=timezone.now()
+            )
+        )
 
 
 class EventParticipation(BaseModel):
@@ -375,6 +537,8 @@ class EventParticipation(BaseModel):
         CONFIRMED = "confirmed", "Confirmado"
         DECLINED = "declined", "Recusado"
 
+    _CONFIRMED = Status.CONFIRMED.value
+
     event = models.ForeignKey(
         Event,
         on_delete=models.CASCADE,
@@ -417,11 +581,26 @@ class EventParticipation(BaseModel):
         blank=True,
     )
 
+    objects = EventParticipationManager()
+
     class Meta:
         verbose_name = "Participação"
         verbose_name_plural = "Participações"
-        unique_together = ["event", "guardian"]
         ordering = ["-created_at"]
+        constraints = [
+            models.UniqueConstraint(
+                fields=["event", "guardian"],
+                name="uniq_event_participation",
+            ),
+        ]
+        indexes = [
+            # Only confirmed rows are looked up by status; other states stay out of the index
+            models.Index(
+                fields=["event", "guardian"],
+                condition=models.Q(status="confirmed"),
+                name="confirmed_participation_idx",
+            ),
+        ]
 
     def __str__(self) -> str:
         return f"{self.guardian} - {self.event.title}"
@@ -439,9 +618,12 @@ class EventParticipation(BaseModel):
         """Decline participation in the event."""
         self.status = self.Status.DECLINED
         self.notes = notes
-        self.save(update_fields=["status", "notes", "updated_at"])
+        self.updated_at = timezone.now()
+        EventParticipation.objects.filter(pk=self.pk).update(
+            status=self.status, notes=notes, updated_at=self.updated_at
+        )
 
     @property
     def is_confirmed(self) -> bool:
         """Check if participation is confirmed."""
-        return self.status == self.Status.CONFIRMED
+        return self.status == self._CONFIRMED
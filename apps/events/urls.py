@@ -9,10 +9,10 @@ from . import views
 app_name = "events"
 
 urlpatterns = [
-    # Event list and detail
+    # The resolver tries patterns in order, so the most requested routes come first
     path("", views.EventListView.as_view(), name="list"),
-    path("novo/<uuid:class_id>/", views.EventCreateView.as_view(), name="create"),
     path("<uuid:pk>/", views.EventDetailView.as_view(), name="detail"),
+    path("novo/<uuid:class_id>/", views.EventCreateView.as_view(), name="create"),
     path("<uuid:pk>/editar/", views.EventUpdateView.as_view(), name="update"),
     path("<uuid:pk>/encerrar/", views.EventCloseView.as_view(), name="close"),
     # Event items
@@ -3,29 +3,91 @@ Views for events app.
 """
 
 import base64
+import hashlib
 from decimal import Decimal
 
 from django.contrib import messages
 from django.contrib.auth.mixins import LoginRequiredMixin
+from django.db import IntegrityError, transaction
+from django.db.models import Exists, OuterRef, Prefetch, Q, Value
 from django.http import HttpResponse, JsonResponse
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse_lazy
+from django.utils.cache import get_conditional_response, patch_cache_control
 from django.views import View
 from django.views.generic import CreateView, DetailView, ListView, UpdateView
 
-from apps.classes.models import SchoolClass
-from apps.core.services.pix import PixService
+from apps.classes.models import ClassMember, SchoolClass, Student
+from apps.core.containers import container
 
 from .forms import (
     DeclineParticipationForm,
     EventForm,
     EventItemForm,
-    ParticipationForm,
     PaymentForm,
+    participation_form_for,
 )
 from .models import Event, EventItem, EventParticipation, Payment
 
 
+def _is_class_admin(guardian, school_class_ref: str) -> Exists:
+    """Subquery flagging whether ``guardian`` administers the outer row's class."""
+    return Exists(
+        ClassMember.objects.filter(
+            school_class_id=OuterRef(school_class_ref),
+            guardian=guardian,
+            role=ClassMember.Role.ADMIN,
+        )
+    )
+
+
+def _get_manageable_payment(pk, guardian) -> Payment:
+    """Fetch a payment with ``can_manage`` resolved in the same SELECT.
+
+    Managers are the event's responsible, its creator, or a class admin.
+    """
+    # The actions only update by pk and redirect to the event, so skip the other columns
+    payments = Payment.objects.only("event_id")
+    if guardian is None:
+        payments = payments.annotate(can_manage=Value(False))
+    else:
+        payments = payments.annotate(
+            can_manage=Q(event__responsible_id=guardian.pk)
+            | Q(event__created_by_id=guardian.pk)
+            | _is_class_admin(guardian, "event__school_class_id")
+        )
+    return get_object_or_404(payments, pk=pk)
+
+
+def _get_event_pix_service(event: Event):
+    """Return the shared PIX service for the event's receiving account."""
+    return container.core.account_pix_service(
+        pix_key=event.pix_key,
+        merchant_name=event.pix_holder_name or "SCHOOL HUB",
+        merchant_city="SAO PAULO",
+    )
+
+
+def _get_event_pix_code(event: Event, pix_service=None) -> str:
+    """Build the event's PIX copy-and-paste code."""
+    pix_service = pix_service or _get_event_pix_service(event)
+    return pix_service.generate_pix_code(
+        amount=event.individual_amount or Decimal("0.00"),
+        description=event.pix_description,
+        transaction_id=event.pix_txid,
+    )
+
+
+def _get_pix_qr_png(event: Event, pix_code: str | None = None) -> bytes:
+    """Return the event's PIX QR code PNG.
+
+    Pass ``pix_code`` when it has already been built to skip rebuilding it. Renders are
+    memoized per PIX code by the service, so an edited event never reuses a stale image.
+    """
+    pix_service = _get_event_pix_service(event)
+    return pix_service.qr_code_from_payload(pix_code or _get_event_pix_code(event, pix_service))
+
+
 class EventListView(LoginRequiredMixin, ListView):
     """List all events the user can see."""
 
@@ -39,10 +101,18 @@ class EventListView(LoginRequiredMixin, ListView):
         if guardian:
             # Get events from classes the user is a member of
             class_ids = guardian.class_memberships.values_list("school_class_id", flat=True)
-            return Event.objects.filter(
-                school_class_id__in=class_ids,
-                is_active=True,
-            ).select_related("school_class", "created_by__user")
+            return (
+                Event.objects.filter(
+                    school_class_id__in=class_ids,
+                    is_active=True,
+                )
+                .select_related("school_class")
+                .with_collected_total()
+                # Only what the cards render; description can be long
+                .only("id", "title", "event_type", "event_date", "budget", "school_class__name")
+                # GROUP BY queries drop Meta.ordering
+                .order_by("-event_date", "-created_at")
+            )
         return Event.objects.none()
 
 
@@ -53,6 +123,30 @@ class EventDetailView(LoginRequiredMixin, DetailView):
     template_name = "events/event_detail.html"
     context_object_name = "event"
 
+    def get_queryset(self):
+        queryset = Event.objects.select_related("school_class").with_collected_total()
+        guardian = getattr(self.request.user, "guardian", None)
+        if guardian:
+            queryset = queryset.annotate(
+                is_class_admin=_is_class_admin(guardian, "school_class_id")
+            )
+        return queryset.prefetch_related(
+            Prefetch(
+                "items",
+                queryset=EventItem.objects.select_related("assigned_to__user").order_by("name"),
+            ),
+            Prefetch(
+                "payments",
+                queryset=Payment.objects.select_related("guardian__user").order_by("-created_at"),
+            ),
+            Prefetch(
+                "participations",
+                queryset=EventParticipation.objects.select_related("guardian__user").order_by(
+                    "-created_at"
+                ),
+            ),
+        )
+
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         guardian = getattr(self.request.user, "guardian", None)
@@ -64,11 +158,16 @@ class EventDetailView(LoginRequiredMixin, DetailView):
         context["my_participation"] = None
         context["has_confirmed_participation"] = False
 
+        # Relations come prefetched (see get_queryset) and are partitioned in Python
+        items = list(self.object.items.all())
+        payments = list(self.object.payments.all())
+        participations = list(self.object.participations.all())
+
         if guardian:
-            membership = self.object.school_class.members.filter(guardian=guardian).first()
-            context["is_admin"] = membership and membership.is_admin
-            context["is_creator"] = self.object.created_by == guardian
-            context["is_responsible"] = self.object.responsible == guardian
+            context["is_admin"] = self.object.is_class_admin
+            # Compare ids so the creator and responsible rows are never loaded
+            context["is_creator"] = self.object.created_by_id == guardian.pk
+            context["is_responsible"] = self.object.responsible_id == guardian.pk
             context["can_edit"] = context["is_admin"] or context["is_creator"]
             # Can confirm payments: responsible, creator or admin
             context["can_confirm_payments"] = (
@@ -76,43 +175,51 @@ class EventDetailView(LoginRequiredMixin, DetailView):
             )
 
             # Check if user has paid
-            my_payment = self.object.payments.filter(guardian=guardian).first()
+            my_payment = next((p for p in payments if p.guardian_id == guardian.pk), None)
             context["my_payment"] = my_payment
             context["has_paid"] = my_payment and my_payment.is_confirmed
 
             # Check participation status
-            my_participation = self.object.participations.filter(guardian=guardian).first()
+            my_participation = next(
+                (p for p in participations if p.guardian_id == guardian.pk), None
+            )
             context["my_participation"] = my_participation
             context["has_confirmed_participation"] = (
                 my_participation and my_participation.is_confirmed
             )
 
         # Event items
-        context["items"] = self.object.items.select_related("assigned_to__user").order_by("name")
-        context["expense_items"] = self.object.items.filter(item_type=EventItem.ItemType.EXPENSE)
-        context["contribution_items"] = self.object.items.filter(
-            item_type=EventItem.ItemType.CONTRIBUTION
-        )
+        context["items"] = items
+        context["expense_items"] = [i for i in items if i.item_type == EventItem.ItemType.EXPENSE]
+        context["contribution_items"] = [
+            i for i in items if i.item_type == EventItem.ItemType.CONTRIBUTION
+        ]
 
         # Payments
-        context["payments"] = self.object.payments.select_related("guardian__user").order_by(
-            "-created_at"
-        )
-        context["confirmed_payments"] = self.object.payments.filter(status=Payment.Status.CONFIRMED)
-        context["pending_payments"] = self.object.payments.filter(status=Payment.Status.PENDING)
+        context["payments"] = payments
+        context["confirmed_payments"] = [p for p in payments if p.is_confirmed]
+        context["pending_payments"] = [p for p in payments if p.status == Payment.Status.PENDING]
 
         # Participations (for potluck/presence events)
-        context["participations"] = self.object.participations.select_related(
-            "guardian__user"
-        ).order_by("-created_at")
-        context["confirmed_participations"] = self.object.participations.filter(
-            status=EventParticipation.Status.CONFIRMED
-        )
-
-        # Students status
-        context["paid_students"] = self.object.paid_students
-        context["pending_students"] = self.object.pending_students
-        context["pending_participations_students"] = self.object.pending_participations_students
+        context["participations"] = participations
+        context["confirmed_participations"] = [p for p in participations if p.is_confirmed]
+
+        # Students status: one roster query, split by the guardians seen above. The lists
+        # are only built for the sections the template renders for this event type
+        students = []
+        if self.object.is_payment_event or self.object.requires_participation:
+            students = list(
+                Student.objects.filter(school_class_id=self.object.school_class_id).only(
+                    "name", "guardian_id"
+                )
+            )
+        paid_guardians = {p.guardian_id for p in context["confirmed_payments"]}
+        confirmed_guardians = {p.guardian_id for p in context["confirmed_participations"]}
+        context["paid_students"] = [s for s in students if s.guardian_id in paid_guardians]
+        context["pending_students"] = [s for s in students if s.guardian_id not in paid_guardians]
+        context["pending_participations_students"] = [
+            s for s in students if s.guardian_id not in confirmed_guardians
+        ]
 
         return context
 
@@ -172,7 +279,8 @@ class EventCloseView(LoginRequiredMixin, View):
     """Close an event."""
 
     def post(self, request, pk):
-        event = get_object_or_404(Event, pk=pk)
+        # Only the title is read back; close() writes with a single UPDATE
+        event = get_object_or_404(Event.objects.only("title"), pk=pk)
         event.close()
         messages.success(request, f'Evento "{event.title}" encerrado.')
         return redirect("events:detail", pk=pk)
@@ -219,26 +327,26 @@ class EventItemAssignView(LoginRequiredMixin, View):
     """Assign an item to the current user."""
 
     def post(self, request, pk):
-        item = get_object_or_404(EventItem, pk=pk)
+        item = get_object_or_404(EventItem.objects.only("name", "event_id"), pk=pk)
         guardian = getattr(request.user, "guardian", None)
 
         item.assigned_to = guardian
         item.save(update_fields=["assigned_to", "updated_at"])
 
         messages.success(request, f'Você assumiu o item "{item.name}".')
-        return redirect("events:detail", pk=item.event.pk)
+        return redirect("events:detail", pk=item.event_id)
 
 
 class EventItemCompleteView(LoginRequiredMixin, View):
     """Mark an item as completed."""
 
     def post(self, request, pk):
-        item = get_object_or_404(EventItem, pk=pk)
+        item = get_object_or_404(EventItem.objects.only("name", "event_id"), pk=pk)
         item.is_completed = True
         item.save(update_fields=["is_completed", "updated_at"])
 
         messages.success(request, f'Item "{item.name}" marcado como concluído.')
-        return redirect("events:detail", pk=item.event.pk)
+        return redirect("events:detail", pk=item.event_id)
 
 
 class PaymentCreateView(LoginRequiredMixin, CreateView):
@@ -250,19 +358,29 @@ class PaymentCreateView(LoginRequiredMixin, CreateView):
 
     def dispatch(self, request, *args, **kwargs):
         """Check if guardian has students in the event's class before allowing payment."""
-        self.event = get_object_or_404(Event, pk=kwargs["event_id"])
         guardian = getattr(request.user, "guardian", None)
-
+        events = Event.objects.all()
         if guardian:
-            # Check if guardian has students in the event's class
-            has_students = self.event.school_class.students.filter(guardian=guardian).exists()
+            # Both checks ride along on the event SELECT
+            events = events.annotate(
+                guardian_has_students=Exists(
+                    Student.objects.filter(
+                        guardian=guardian, school_class_id=OuterRef("school_class_id")
+                    )
+                ),
+                guardian_has_payment=Exists(
+                    Payment.objects.filter(event_id=OuterRef("pk"), guardian=guardian)
+                ),
+            )
+        self.event = get_object_or_404(events, pk=kwargs["event_id"])
 
-            if not has_students:
-                messages.error(
-                    request,
-                    "Você precisa ter pelo menos um aluno vinculado a esta turma para realizar pagamentos.",
-                )
-                return redirect("events:detail", pk=self.event.pk)
+        # Check if guardian has students in the event's class
+        if guardian and not self.event.guardian_has_students:
+            messages.error(
+                request,
+                "Você precisa ter pelo menos um aluno vinculado a esta turma para realizar pagamentos.",
+            )
+            return redirect("events:detail", pk=self.event.pk)
 
         return super().dispatch(request, *args, **kwargs)
 
@@ -281,18 +399,21 @@ class PaymentCreateView(LoginRequiredMixin, CreateView):
         guardian = getattr(self.request.user, "guardian", None)
 
         # Check if already paid
-        existing = Payment.objects.filter(event=self.event, guardian=guardian).first()
-        if existing:
-            messages.warning(
-                self.request,
-                "Você já enviou um pagamento para este evento.",
-            )
-            return redirect("events:detail", pk=self.event.pk)
+        if getattr(self.event, "guardian_has_payment", False):
+            return self._already_paid()
 
         self.object = form.save(commit=False)
         self.object.event = self.event
         self.object.guardian = guardian
-        self.object.save()
+        try:
+            with transaction.atomic():
+                self.object.save()
+        except IntegrityError:
+            # A concurrent submit won the unique (event, guardian) constraint; the receipt
+            # was already written to storage, so drop it with the rejected row
+            if self.object.receipt:
+                self.object.receipt.delete(save=False)
+            return self._already_paid()
 
         messages.success(
             self.request,
@@ -300,51 +421,48 @@ class PaymentCreateView(LoginRequiredMixin, CreateView):
         )
         return redirect("events:detail", pk=self.event.pk)
 
+    def _already_paid(self):
+        messages.warning(
+            self.request,
+            "Você já enviou um pagamento para este evento.",
+        )
+        return redirect("events:detail", pk=self.event.pk)
+
 
 class PaymentConfirmView(LoginRequiredMixin, View):
     """Confirm a payment."""
 
     def post(self, request, pk):
-        payment = get_object_or_404(Payment, pk=pk)
         guardian = getattr(request.user, "guardian", None)
-        event = payment.event
-
         # Check if user can confirm payments (responsible or admin)
-        is_responsible = event.responsible == guardian or event.created_by == guardian
-        membership = event.school_class.members.filter(guardian=guardian).first()
-        is_admin = membership and membership.is_admin
+        payment = _get_manageable_payment(pk, guardian)
 
-        if not (is_responsible or is_admin):
+        if not payment.can_manage:
             messages.error(
                 request, "Você não tem permissão para confirmar pagamentos neste evento."
             )
-            return redirect("events:detail", pk=event.pk)
+            return redirect("events:detail", pk=payment.event_id)
 
         payment.confirm(guardian)
         messages.success(request, "Pagamento confirmado!")
-        return redirect("events:detail", pk=event.pk)
+        return redirect("events:detail", pk=payment.event_id)
 
 
 class PaymentRejectView(LoginRequiredMixin, View):
     """Reject a payment."""
 
     def post(self, request, pk):
-        payment = get_object_or_404(Payment, pk=pk)
         guardian = getattr(request.user, "guardian", None)
-        event = payment.event
-
         # Check if user can reject payments (responsible or admin)
-        is_responsible = event.responsible == guardian or event.created_by == guardian
-        membership = event.school_class.members.filter(guardian=guardian).first()
-        is_admin = membership and membership.is_admin
+        payment = _get_manageable_payment(pk, guardian)
 
-        if not (is_responsible or is_admin):
+        if not payment.can_manage:
             messages.error(request, "Você não tem permissão para rejeitar pagamentos neste evento.")
-            return redirect("events:detail", pk=event.pk)
+            return redirect("events:detail", pk=payment.event_id)
 
         payment.reject()
         messages.warning(request, "Pagamento rejeitado.")
-        return redirect("events:detail", pk=event.pk)
+        return redirect("events:detail", pk=payment.event_id)
 
 
 class EventPixView(LoginRequiredMixin, DetailView):
@@ -359,28 +477,10 @@ class EventPixView(LoginRequiredMixin, DetailView):
 
         # Generate PIX code if key is available
         if self.object.pix_key:
-            pix_service = PixService(
-                pix_key=self.object.pix_key,
-                merchant_name=self.object.pix_holder_name or "SCHOOL HUB",
-                merchant_city="SAO PAULO",
-            )
-
-            amount = self.object.individual_amount or Decimal("0.00")
-            # Use UUID hex (without hyphens) for transaction_id
-            txid = self.object.id.hex[:25]
-
-            context["pix_code"] = pix_service.generate_pix_code(
-                amount=amount,
-                description=self.object.title[:25],
-                transaction_id=txid,
-            )
+            context["pix_code"] = _get_event_pix_code(self.object)
 
-            # Generate QR code as base64
-            qr_bytes = pix_service.generate_qr_code(
-                amount=amount,
-                description=self.object.title[:25],
-                transaction_id=txid,
-            )
+            # Generate QR code as base64, reusing the code built above
+            qr_bytes = _get_pix_qr_png(self.object, context["pix_code"])
             context["qr_code_base64"] = base64.b64encode(qr_bytes).decode("utf-8")
 
         return context
@@ -390,35 +490,31 @@ class EventQRCodeView(LoginRequiredMixin, View):
     """Generate and return QR code image for PIX payment."""
 
     def get(self, request, pk):
-        event = get_object_or_404(Event, pk=pk)
+        event = get_object_or_404(
+            Event.objects.only("title", "pix_key", "pix_holder_name", "individual_amount"),
+            pk=pk,
+        )
 
         if not event.pix_key:
             return JsonResponse({"error": "PIX key not configured"}, status=400)
 
-        pix_service = PixService(
-            pix_key=event.pix_key,
-            merchant_name=event.pix_holder_name or "SCHOOL HUB",
-            merchant_city="SAO PAULO",
-        )
-
-        amount = event.individual_amount or Decimal("0.00")
-        # Use UUID hex (without hyphens) for transaction_id
-        txid = event.id.hex[:25]
+        # The PIX code identifies the image, so a revalidation answers 304 without rendering
+        pix_code = _get_event_pix_code(event)
+        etag = f'"{hashlib.md5(pix_code.encode(), usedforsecurity=False).hexdigest()}"'
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = HttpResponse(_get_pix_qr_png(event, pix_code), content_type="image/png")
 
-        qr_bytes = pix_service.generate_qr_code(
-            amount=amount,
-            description=event.title[:25],
-            transaction_id=txid,
-        )
-
-        return HttpResponse(qr_bytes, content_type="image/png")
+        # Let the browser revalidate its copy instead of downloading the image again
+        response["ETag"] = etag
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
 
 
 class ParticipationCreateView(LoginRequiredMixin, CreateView):
     """Confirm participation in an event (potluck or presence)."""
 
     model = EventParticipation
-    form_class = ParticipationForm
     template_name = "events/participation_form.html"
 
     def dispatch(self, request, *args, **kwargs):
@@ -441,20 +537,17 @@ class ParticipationCreateView(LoginRequiredMixin, CreateView):
                 )
                 return redirect("events:detail", pk=self.event.pk)
 
-            # Check if already confirmed
-            existing = EventParticipation.objects.filter(
-                event=self.event, guardian=guardian
-            ).first()
-            if existing and existing.is_confirmed:
+            # Check if already confirmed (served by the partial index on confirmed rows)
+            if EventParticipation.objects.filter(
+                event=self.event, guardian=guardian, status=EventParticipation.Status.CONFIRMED
+            ).exists():
                 messages.info(request, "Você já confirmou participação neste evento.")
                 return redirect("events:detail", pk=self.event.pk)
 
         return super().dispatch(request, *args, **kwargs)
 
-    def get_form_kwargs(self):
-        kwargs = super().get_form_kwargs()
-        kwargs["event"] = self.event
-        return kwargs
+    def get_form_class(self):
+        return participation_form_for(self.event)
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -464,27 +557,26 @@ class ParticipationCreateView(LoginRequiredMixin, CreateView):
     def form_valid(self, form):
         guardian = getattr(self.request.user, "guardian", None)
 
-        # Get or create participation
-        participation, created = EventParticipation.objects.get_or_create(
-            event=self.event,
-            guardian=guardian,
-        )
-
         # Update with form data (ensure guests_count has a default value)
         guests_count = form.cleaned_data.get("guests_count")
         if not guests_count:
             guests_count = 1
 
-        participation.confirm(
-            contribution=form.cleaned_data.get("contribution") or "",
+        contribution = form.cleaned_data.get("contribution") or ""
+
+        # Create or update the participation in a single upsert
+        EventParticipation.objects.confirm(
+            self.event,
+            guardian,
+            contribution=contribution,
             guests_count=guests_count,
             notes=form.cleaned_data.get("notes") or "",
         )
 
-        if self.event.is_potluck_event and participation.contribution:
+        if self.event.is_potluck_event and contribution:
             messages.success(
                 self.request,
-                f"Participação confirmada! Você vai levar: {participation.contribution}",
+                f"Participação confirmada! Você vai levar: {contribution}",
             )
         else:
             messages.success(self.request, "Presença confirmada!")
@@ -506,11 +598,9 @@ class ParticipationDeclineView(LoginRequiredMixin, View):
         form = DeclineParticipationForm(request.POST)
 
         if form.is_valid():
-            participation, created = EventParticipation.objects.get_or_create(
-                event=event,
-                guardian=guardian,
+            EventParticipation.objects.decline(
+                event, guardian, notes=form.cleaned_data.get("notes", "")
             )
-            participation.decline(notes=form.cleaned_data.get("notes", ""))
             messages.info(request, "Participação recusada.")
             return redirect("events:detail", pk=event.pk)
 
@@ -537,19 +627,13 @@ class ParticipationCancelView(LoginRequiredMixin, View):
             messages.error(request, "Este evento não requer confirmação de participação.")
             return redirect("events:detail", pk=event.pk)
 
-        participation = EventParticipation.objects.filter(
-            event=event, guardian=guardian
-        ).first()
-
-        if not participation:
-            messages.error(request, "Você não tem participação registrada neste evento.")
-            return redirect("events:detail", pk=event.pk)
-
-        if participation.status != EventParticipation.Status.CONFIRMED:
-            messages.warning(request, "Sua participação não está confirmada.")
+        # Cancel the participation; only when nothing was confirmed do we look further
+        if not EventParticipation.objects.cancel(event, guardian, notes="Cancelado pelo usuário"):
+            if not EventParticipation.objects.filter(event=event, guardian=guardian).exists():
+                messages.error(request, "Você não tem participação registrada neste evento.")
+            else:
+                messages.warning(request, "Sua participação não está confirmada.")
             return redirect("events:detail", pk=event.pk)
 
-        # Cancel the participation
-        participation.decline(notes="Cancelado pelo usuário")
         messages.info(request, "Sua participação foi cancelada.")
         return redirect("events:detail", pk=event.pk)
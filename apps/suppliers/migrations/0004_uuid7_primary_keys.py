@@ -0,0 +1,24 @@
+# Generated by Django 5.1.15 on 2026-10-14 04:07
+
+import apps.core.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('suppliers', '0003_change_category_to_charfield'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='supplier',
+            name='id',
+            field=models.UUIDField(default=apps.core.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+        migrations.AlterField(
+            model_name='suppliercategory',
+            name='id',
+            field=models.UUIDField(default=apps.core.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
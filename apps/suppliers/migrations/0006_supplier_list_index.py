@@ -0,0 +1,17 @@
+# Generated by Django 5.1.15 on 2026-10-14 04:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('suppliers', '0005_search_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='supplier',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-is_recommended', 'name'], name='supplier_list_idx'),
+        ),
+    ]
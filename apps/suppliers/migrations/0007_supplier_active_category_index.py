@@ -0,0 +1,17 @@
+# Generated by Django 5.1.15 on 2026-10-14 04:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('suppliers', '0006_supplier_list_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='supplier',
+            index=models.Index(condition=models.Q(('is_active', True), models.Q(('category', ''), _negated=True)), fields=['category'], name='supplier_active_category_idx'),
+        ),
+    ]
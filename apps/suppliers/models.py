@@ -2,7 +2,12 @@
 Models for suppliers (vendors, service providers).
 """
 
+from functools import cached_property
+from urllib.parse import quote
+
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 
 from apps.core.models import BaseModel
 
@@ -119,11 +124,36 @@ class Supplier(BaseModel):
         verbose_name = "Fornecedor"
         verbose_name_plural = "Fornecedores"
         ordering = ["name"]
+        # Trigram indexes serving the list's case-insensitive search and category filter
+        indexes = [
+            GinIndex(OpClass(Upper("name"), name="gin_trgm_ops"), name="supplier_name_trgm"),
+            GinIndex(
+                OpClass(Upper("category"), name="gin_trgm_ops"), name="supplier_category_trgm"
+            ),
+            # Matches the list's filter and ORDER BY, so a page is read in order with no sort
+            models.Index(
+                fields=["-is_recommended", "name"],
+                condition=models.Q(is_active=True),
+                name="supplier_list_idx",
+            ),
+            # Lets the category dropdown's DISTINCT be read in order from a small index
+            models.Index(
+                fields=["category"],
+                condition=models.Q(is_active=True) & ~models.Q(category=""),
+                name="supplier_active_category_idx",
+            ),
+            # B-tree over UPPER(name) for the short-search prefix match (istartswith)
+            models.Index(
+                OpClass(Upper("name"), name="text_pattern_ops"),
+                name="supplier_name_prefix",
+            ),
+        ]
 
     def __str__(self) -> str:
         return self.name
 
-    @property
+    # Links are read several times per card; the source fields do not change mid-request
+    @cached_property
     def whatsapp_link(self) -> str:
         """Generate WhatsApp link."""
         phone = "".join(filter(str.isdigit, self.whatsapp or self.phone))
@@ -131,7 +161,7 @@ class Supplier(BaseModel):
             return f"https://wa.me/55{phone}"
         return ""
 
-    @property
+    @cached_property
     def instagram_link(self) -> str:
         """Generate Instagram link."""
         if self.instagram:
@@ -139,12 +169,11 @@ class Supplier(BaseModel):
             return f"https://instagram.com/{username}"
         return ""
 
-    @property
+    @cached_property
     def maps_link(self) -> str:
         """Return Google Maps link."""
         if self.maps_url:
             return self.maps_url
         elif self.address:
-            from urllib.parse import quote
             return f"https://www.google.com/maps/search/?api=1&query={quote(self.address)}"
         return ""
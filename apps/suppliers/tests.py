@@ -0,0 +1,54 @@
+"""
+Tests for the supplier views.
+"""
+
+from django.test import TestCase
+from django.urls import reverse
+
+from apps.accounts.models import User
+from apps.suppliers.models import Supplier
+
+
+def _add_suppliers(start: int, size: int) -> None:
+    Supplier.objects.bulk_create(
+        Supplier(
+            name=f"Fornecedor {i}",
+            category="Buffet" if i % 2 else "Decoração",
+            is_recommended=i % 3 == 0,
+        )
+        for i in range(start, start + size)
+    )
+
+
+class SupplierListQueryCountTests(TestCase):
+    """The list page runs a fixed number of queries, with and without filters."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            email="fornecedores@example.com", password="senha-teste", first_name="Teste"
+        )
+        _add_suppliers(0, 5)
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def test_list_queries(self):
+        url = reverse("suppliers:list")
+        # session, user, paginator count, suppliers, categories
+        with self.assertNumQueries(5):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+        _add_suppliers(5, 10)
+        with self.assertNumQueries(5):
+            response = self.client.get(url)
+        self.assertEqual(len(response.context["suppliers"]), 12)
+        self.assertEqual(list(response.context["categories"]), ["Buffet", "Decoração"])
+
+    def test_filtered_list_queries(self):
+        with self.assertNumQueries(5):
+            response = self.client.get(reverse("suppliers:list"), {"category": "Buffet", "q": "F"})
+        self.assertEqual(len(response.context["suppliers"]), 2)
+        self.assertEqual(response.context["current_category"], "Buffet")
+        self.assertEqual(response.context["search_query"], "F")
@@ -10,6 +10,9 @@ from django.views.generic import CreateView, DetailView, ListView, UpdateView
 from .forms import SupplierForm
 from .models import Supplier
 
+# Trigrams need at least three characters; shorter searches fall back to a prefix match
+MIN_SEARCH_LENGTH = 3
+
 
 class SupplierListView(LoginRequiredMixin, ListView):
     """List all active suppliers."""
@@ -19,20 +22,38 @@ class SupplierListView(LoginRequiredMixin, ListView):
     context_object_name = "suppliers"
     paginate_by = 12
 
+    def setup(self, request, *args, **kwargs):
+        super().setup(request, *args, **kwargs)
+        # Read the filters once; both the queryset and the template use them
+        self.category = request.GET.get("category", "")
+        self.search = request.GET.get("q", "")
+
     def get_queryset(self):
         queryset = Supplier.objects.filter(is_active=True)
 
         # Filter by category if specified
-        category = self.request.GET.get("category")
-        if category:
-            queryset = queryset.filter(category__icontains=category)
+        if self.category:
+            queryset = queryset.filter(category__icontains=self.category)
 
         # Search
-        search = self.request.GET.get("q")
-        if search:
-            queryset = queryset.filter(name__icontains=search)
-
-        return queryset.order_by("-is_recommended", "name")
+        if len(self.search) >= MIN_SEARCH_LENGTH:
+            queryset = queryset.filter(name__icontains=self.search)
+        elif self.search:
+            queryset = queryset.filter(name__istartswith=self.search)
+
+        # Only what the cards render; notes and contact details stay on the detail page
+        return queryset.only(
+            "name",
+            "category",
+            "description",
+            "phone",
+            "whatsapp",
+            "instagram",
+            "maps_url",
+            "address",
+            "rating",
+            "is_recommended",
+        ).order_by("-is_recommended", "name")
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -44,8 +65,8 @@ class SupplierListView(LoginRequiredMixin, ListView):
             .distinct()
             .order_by("category")
         )
-        context["current_category"] = self.request.GET.get("category", "")
-        context["search_query"] = self.request.GET.get("q", "")
+        context["current_category"] = self.category
+        context["search_query"] = self.search
         return context
 
 
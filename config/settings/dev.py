@@ -2,6 +2,8 @@
 Development settings for School Hub project.
 """
 
+from decouple import config
+
 from .base import *  # noqa: F401, F403
 
 DEBUG = True
@@ -11,12 +13,17 @@ ALLOWED_HOSTS = ["localhost", "127.0.0.1", "0.0.0.0"]
 # Development apps
 INSTALLED_APPS += [  # noqa: F405
     "django_extensions",
-    "debug_toolbar",
 ]
 
-MIDDLEWARE = [
-    "debug_toolbar.middleware.DebugToolbarMiddleware",
-] + MIDDLEWARE  # noqa: F405
+# The toolbar wraps every cursor and rewrites every response; set
+# DISABLE_DEBUG_TOOLBAR=True when profiling so timings reflect the app itself
+if not config("DISABLE_DEBUG_TOOLBAR", default=False, cast=bool):
+    INSTALLED_APPS += ["debug_toolbar"]  # noqa: F405
+    # Must follow GZip so the toolbar is injected before the response is compressed
+    MIDDLEWARE.insert(  # noqa: F405
+        MIDDLEWARE.index("django.middleware.gzip.GZipMiddleware") + 1,  # noqa: F405
+        "debug_toolbar.middleware.DebugToolbarMiddleware",
+    )
 
 # Debug Toolbar
 INTERNAL_IPS = [
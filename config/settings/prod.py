@@ -19,7 +19,12 @@ SECURE_HSTS_PRELOAD = True
 
 # Static files with WhiteNoise
 MIDDLEWARE.insert(1, "whitenoise.middleware.WhiteNoiseMiddleware")  # noqa: F405
-STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
+# Django 5.1 only reads STORAGES (STATICFILES_STORAGE was removed); hashed names let
+# WhiteNoise serve assets precompressed with far-future cache headers
+STORAGES = {
+    "default": {"BACKEND": "django.core.files.storage.FileSystemStorage"},
+    "staticfiles": {"BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage"},
+}
 
 # Logging
 LOGGING = {
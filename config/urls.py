@@ -23,12 +23,10 @@ if settings.DEBUG:
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
     urlpatterns += static(settings.STATIC_URL, document_root=settings.STATICFILES_DIRS[0])
 
-    # Debug toolbar
-    try:
+    # Debug toolbar (left out of INSTALLED_APPS when DISABLE_DEBUG_TOOLBAR is set)
+    if "debug_toolbar" in settings.INSTALLED_APPS:
         import debug_toolbar
 
         urlpatterns = [
             path("__debug__/", include(debug_toolbar.urls)),
         ] + urlpatterns
-    except ImportError:
-        pass